@@ -2,12 +2,15 @@
 
 __all__ = [
     "CoverityChecker",
+    "CoverityJsonChecker",
+    "CustomRegexChecker",
     "DoxyChecker",
     "Finding",
     "JUnitChecker",
     "PolyspaceChecker",
     "PolyspaceFamilyChecker",
     "RobotChecker",
+    "RobotOutputChecker",
     "RobotSuiteChecker",
     "SphinxChecker",
     "WarningsChecker",
@@ -21,10 +24,11 @@ __all__ = [
 
 from .__version__ import __version__
 from .code_quality import Finding
+from .coverity_json_checker import CoverityJsonChecker
 from .exceptions import WarningsConfigError
 from .junit_checker import JUnitChecker
 from .polyspace_checker import PolyspaceChecker, PolyspaceFamilyChecker
-from .regex_checker import CoverityChecker, DoxyChecker, SphinxChecker, XMLRunnerChecker
-from .robot_checker import RobotChecker, RobotSuiteChecker
+from .regex_checker import CoverityChecker, CustomRegexChecker, DoxyChecker, SphinxChecker, XMLRunnerChecker
+from .robot_checker import RobotChecker, RobotOutputChecker, RobotSuiteChecker
 from .warnings import WarningsPlugin, warnings_wrapper
 from .warnings_checker import WarningsChecker
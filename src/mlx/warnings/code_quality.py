@@ -8,6 +8,9 @@ class Finding:
     """A dictionary mapping fingerprints (unique hashes) to instances of Finding"""
     fingerprints = {}
 
+    """The supported severity levels, from lowest to highest"""
+    SEVERITIES = ("info", "minor", "major", "critical", "blocker")
+
     _severity = "info"
     _path = ""
     _line = 1
@@ -44,9 +47,8 @@ class Finding:
 
     @severity.setter
     def severity(self, value):
-        expected_values = ["info", "minor", "major", "critical", "blocker"]
-        if value not in expected_values:
-            raise ValueError(f"Expected severity to be one of {expected_values}; Got {value!r}")
+        if value not in self.SEVERITIES:
+            raise ValueError(f"Expected severity to be one of {list(self.SEVERITIES)}; Got {value!r}")
         self._severity = value
 
     @property
@@ -56,6 +58,21 @@ class Finding:
 
     @path.setter
     def path(self, value):
+        self._path = self.relative_path(value)
+
+    @staticmethod
+    def relative_path(value):
+        """Converts an absolute path to a path relative to the current working directory
+
+        Args:
+            value (str): The path
+
+        Returns:
+            str: The relative path
+
+        Raises:
+            ValueError: The absolute path is not in the current working directory
+        """
         path = Path(value)
         if path.is_absolute():
             try:
@@ -63,7 +80,7 @@ class Finding:
             except ValueError as err:
                 raise ValueError("Failed to convert abolute path to relative path for Code Quality report: "
                                  f"{err}") from err
-        self._path = str(path)
+        return str(path)
 
     @property
     def line(self):
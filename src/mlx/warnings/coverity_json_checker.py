@@ -0,0 +1,240 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import re
+
+from .regex_checker import CoverityChecker, CoverityClassificationChecker, coverity_pattern
+
+ITEM_SEPARATOR = re.compile(r"[\s,]*")
+STRUCTURAL_CHARACTER = re.compile(r'["{}\[\]]')
+STRING_SPECIAL_CHARACTER = re.compile(r'["\\]')
+
+
+class CoverityIssue:
+    """Occurrence of a defect in the JSON export of Coverity, with the groups of a match of ``coverity_pattern``
+
+    The classification sub-checkers handle it like a regex match of the text output, so that the exclusions, the
+    Code Quality mapping and the description template of the text output apply.
+    """
+    __slots__ = ("groups", "text")
+    re = coverity_pattern
+    group_names = {index: name for name, index in coverity_pattern.groupindex.items()}
+
+    def __init__(self, issue):
+        """Constructor
+
+        Issues without a CID, e.g. of an analysis that is not connected to a server, are identified by their merge key.
+
+        Args:
+            issue (dict): Issue of the ``issues`` list of the JSON export
+        """
+        state = issue.get("stateOnServer") or {}
+        triage = state.get("triage") or {}
+        checker = issue.get("checkerName", "")
+        if description := (issue.get("checkerProperties") or {}).get("subcategoryShortDescription"):
+            checker = f"{description} ({checker})"
+        self.groups = {
+            "path": issue.get("mainEventFilePathname", ""),
+            "line": _string_or_none(issue.get("mainEventLineNumber")),
+            "column": None,
+            "cid": str(state.get("cid") or issue.get("mergeKey", "")),
+            "curr": str(issue.get("occurrenceNumberInMK", 1)),
+            "max": str(issue.get("occurrenceCountForMK", 1)),
+            "checker": checker,
+            "classification": triage.get("classification") or "Unclassified",
+        }
+        triage_values = ", ".join(str(value) for value in (triage.get("severity"), triage.get("action")) if value)
+        self.text = (f"{self.groups['path']}:{self.groups['line']}: CID {self.groups['cid']} "
+                     f"(#{self.groups['curr']} of {self.groups['max']}): {checker}: {self.groups['classification']}")
+        if triage_values:
+            self.text += f", {triage_values}"
+        if owner := triage.get("owner"):
+            self.text += f", owner is {owner}"
+
+    @property
+    def key(self):
+        """int/str: The CID of the defect, or its merge key if it has no CID"""
+        cid = self.groups["cid"]
+        return int(cid) if cid.isdigit() else cid
+
+    def group(self, group=0):
+        """Returns the value of a group by its name or index, with index 0 for the line of text of the issue"""
+        if group == 0:
+            return self.text
+        return self.groups.get(self.group_names.get(group, group))
+
+    def groupdict(self):
+        return dict(self.groups)
+
+    def start(self):
+        return 0
+
+
+def _string_or_none(value):
+    return None if value is None else str(value)
+
+
+class CoverityJsonChecker(CoverityChecker):
+    """Checker for the JSON export of Coverity, e.g. of ``cov-format-errors --json-output-v7``
+
+    The issues are decoded one by one while the input is fed, so that the document is never held in memory as a whole.
+    Each issue is an occurrence of a defect that goes through the same pipeline per CID as the events of the text
+    output, with the same classification sub-checkers.
+    """
+    name = "coverity_json"
+
+    def __init__(self, *logging_args):
+        super().__init__(*logging_args)
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._in_issues = False
+        self._issues_done = False
+        self._reset_scan()
+
+    @property
+    def name_repr(self):
+        return "Coverity JSON"
+
+    @property
+    def sub_logger_name(self):
+        return CoverityClassificationChecker.name
+
+    def check(self, content):
+        """Function for counting the number of defects in a complete JSON document
+
+        Args:
+            content (str): The JSON document to parse
+        """
+        self.feed(content)
+        self.flush()
+
+    def feed(self, chunk):
+        """Decodes the issues that are complete after appending a chunk of the JSON document
+
+        Args:
+            chunk (str): The next part of the JSON document
+        """
+        if self._issues_done:
+            return
+        if not self._in_issues:
+            if (array_start := self._scan_for_issues(chunk)) is None:
+                self._log_line_offset += chunk.count("\n")
+                return
+            self._log_line_offset += chunk.count("\n", 0, array_start)
+            self._in_issues = True
+            chunk = chunk[array_start:]
+        self._buffer += chunk
+        pos = 0
+        counted_pos = 0  # the newlines before this position have been added to the line offset
+        while True:
+            pos = ITEM_SEPARATOR.match(self._buffer, pos).end()
+            if pos == len(self._buffer):
+                break
+            if self._buffer[pos] == "]":
+                self._issues_done = True
+                break
+            try:
+                issue, end = self._decoder.raw_decode(self._buffer, pos)
+            except json.JSONDecodeError:
+                break  # the issue is incomplete; it gets decoded once the next chunk has been fed
+            self._log_line_offset += self._buffer.count("\n", counted_pos, pos)
+            counted_pos = pos
+            self._check_issue(issue, self._log_line_offset + 1)
+            pos = end
+        self._log_line_offset += self._buffer.count("\n", counted_pos, pos)
+        self._buffer = "" if self._issues_done else self._buffer[pos:]
+
+    def flush(self):
+        """Reports a JSON document that ended before its list of issues did and prepares for the next document"""
+        if not self._issues_done:
+            if not self._in_issues:
+                self.logger.error("No list of 'issues' found in the Coverity JSON input")
+            else:
+                try:
+                    self._decoder.raw_decode(self._buffer.lstrip(" \t\r\n,"))
+                except json.JSONDecodeError as err:
+                    self.logger.error(f"Incomplete Coverity JSON input: {err}")
+        self._buffer = ""
+        self._in_issues = False
+        self._issues_done = False
+        self._reset_scan()
+        self._log_line_offset = 0
+
+    def _reset_scan(self):
+        """Resets the state of the scan for the list of issues, for the start of a document"""
+        self._depth = 0  # amount of objects and arrays that the scan is in
+        self._in_string = False
+        self._escaped = False
+        self._string = ""  # start of the string of the root object that is being scanned
+        self._key_state = 0  # 1 after the key "issues" of the root object, 2 after its colon
+
+    def _scan_for_issues(self, text):
+        """Scans the next part of the document for the start of the list of issues of the root object
+
+        Only the state of the scan is kept, so that the part of the document before the list is not held in memory.
+        Strings are skipped, so that a string value that contains ``"issues": [`` is not taken for the list.
+
+        Args:
+            text (str): The next part of the document
+
+        Returns:
+            int/None: The position in the text right after the ``[`` of the list of issues, None if not found yet
+        """
+        pos = 0
+        while pos < len(text):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                    self._string = None
+                    pos += 1
+                    continue
+                special = STRING_SPECIAL_CHARACTER.search(text, pos)
+                end = special.start() if special else len(text)
+                if self._string is not None:
+                    self._string = (self._string + text[pos:end])[:len("issues") + 1]
+                if not special:
+                    return None
+                pos = special.end()
+                if special.group() == "\\":
+                    self._escaped = True
+                    continue
+                self._in_string = False
+                self._key_state = int(self._depth == 1 and self._string == "issues")
+                continue
+            char = text[pos]
+            if char in " \t\r\n":
+                pos += 1
+                continue
+            if self._key_state == 1 and char == ":":
+                self._key_state = 2
+                pos += 1
+                continue
+            if self._key_state == 2 and char == "[":
+                self._depth += 1
+                return pos + 1
+            self._key_state = 0
+            if char == '"':
+                self._in_string = True
+                self._string = ""
+                pos += 1
+                continue
+            if char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+            structural = STRUCTURAL_CHARACTER.search(text, pos + 1)
+            pos = structural.start() if structural else len(text)
+        return None
+
+    def _check_issue(self, issue, log_line=None):
+        """Adds an issue of the JSON export as an event of its defect
+
+        Args:
+            issue (dict): Decoded issue
+            log_line (int/None): Number of the line in the input where the issue starts
+        """
+        if not isinstance(issue, dict):
+            self.logger.error(f"Unexpected item in the list of Coverity issues: {issue!r}")
+            return
+        issue = CoverityIssue(issue)
+        self._add_event(issue.key, issue, log_line)
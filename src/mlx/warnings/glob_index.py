@@ -0,0 +1,165 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Index of gitignore-style globs that matches a path by walking its components once"""
+
+import posixpath
+import re
+from fnmatch import translate
+
+
+class _Node:
+    __slots__ = ("children", "wildcards", "globstar", "is_globstar", "glob", "dir_only")
+
+    def __init__(self, is_globstar=False):
+        self.children = {}  # literal component -> _Node
+        self.wildcards = []  # (compiled component glob, _Node)
+        self.globstar = None  # _Node that consumes any number of components
+        self.is_globstar = is_globstar
+        self.glob = None  # original glob when a glob ends in this node
+        self.dir_only = False
+
+
+class GlobIndex:
+    """Directory trie of gitignore-style globs
+
+    The supported syntax:
+
+    - ``*``, ``?`` and ``[...]`` match within a single path component;
+    - ``**`` matches zero or more components;
+    - a glob without a slash, e.g. ``*.pb.c``, matches the name of a file or directory at any depth;
+    - a glob with a slash, e.g. ``/src/gen`` or ``third_party/lib``, is anchored to the root of the path;
+    - a glob with a trailing slash or ``/**``, e.g. ``third_party/``, only matches directories;
+    - everything inside a matched directory is matched as well.
+
+    An absolute path is made relative to ``root`` before it is matched, if it is located inside that directory.
+
+    Args:
+        globs (Iterable[str]): The gitignore-style globs
+        root (str/None): Absolute path of the directory that anchored globs are relative to
+    """
+
+    def __init__(self, globs=(), root=None):
+        self._root = _Node()
+        self._root_prefix = root.replace("\\", "/").rstrip("/") + "/" if root else None
+        for glob in globs:
+            self.add(glob)
+
+    def add(self, glob):
+        """Adds a glob to the index
+
+        Args:
+            glob (str): The gitignore-style glob
+        """
+        pattern = glob.strip()
+        dir_only = False
+        if pattern.endswith("/**"):
+            pattern = pattern[:-3]
+            dir_only = True
+        elif pattern.endswith("/"):
+            pattern = pattern.rstrip("/")
+            dir_only = True
+        if "/" in pattern:
+            pattern = pattern.lstrip("/")
+        else:
+            pattern = f"**/{pattern}"
+        node = self._root
+        for component in pattern.split("/"):
+            if component == "**":
+                if node.globstar is None:
+                    node.globstar = _Node(is_globstar=True)
+                node = node.globstar
+            elif any(char in component for char in "*?["):
+                for wildcard, child in node.wildcards:
+                    if wildcard.pattern == translate(component):
+                        node = child
+                        break
+                else:
+                    child = _Node()
+                    node.wildcards.append((re.compile(translate(component)), child))
+                    node = child
+            else:
+                node = node.children.setdefault(component, _Node())
+        if node.glob is None or node.dir_only:
+            node.glob = glob
+            node.dir_only = dir_only
+
+    def __bool__(self):
+        return bool(self._root.children or self._root.wildcards or self._root.globstar)
+
+    @staticmethod
+    def _expand(nodes):
+        """Adds the nodes that are reachable by letting ``**`` match zero components"""
+        expanded = []
+        for node in nodes:
+            while node is not None and node not in expanded:
+                expanded.append(node)
+                node = node.globstar
+        return expanded
+
+    def match(self, path):
+        """Matches a path against the globs in the index
+
+        Args:
+            path (str): The path to match, with forward or backward slashes
+
+        Returns:
+            str/None: The first glob that matches the path, None if none of them matches
+        """
+        path = posixpath.normpath(path.replace("\\", "/"))
+        if self._root_prefix and path.startswith(self._root_prefix):
+            path = path[len(self._root_prefix):]
+        components = [component for component in path.split("/") if component not in ("", ".")]
+        states = self._expand([self._root])
+        last_index = len(components) - 1
+        for index, component in enumerate(components):
+            next_states = []
+            for node in states:
+                if node.is_globstar:
+                    next_states.append(node)
+                if (child := node.children.get(component)) is not None:
+                    next_states.append(child)
+                next_states.extend(child for wildcard, child in node.wildcards if wildcard.match(component))
+            states = self._expand(next_states)
+            for node in states:
+                if node.glob is not None and (index < last_index or not node.dir_only):
+                    return node.glob
+            if not states:
+                break
+        return None
+
+
+class GlobList:
+    """List of globs that match the whole value of a field that is not a path, e.g. the name of a Coverity checker
+
+    ``*``, ``?`` and ``[...]`` have the meaning of :mod:`fnmatch`, so that ``*`` matches slashes as well.
+
+    Args:
+        globs (Iterable[str]): The globs
+    """
+
+    def __init__(self, globs=()):
+        self._globs = []
+        for glob in globs:
+            self.add(glob)
+
+    def add(self, glob):
+        """Adds a glob to the list
+
+        Args:
+            glob (str): The glob
+        """
+        self._globs.append((re.compile(translate(glob.strip())), glob))
+
+    def __bool__(self):
+        return bool(self._globs)
+
+    def match(self, value):
+        """Matches a value against the globs in the list
+
+        Args:
+            value (str): The value to match
+
+        Returns:
+            str/None: The first glob that matches the value, None if none of them matches
+        """
+        return next((glob for pattern, glob in self._globs if pattern.match(value)), None)
@@ -1,57 +1,277 @@
 # SPDX-License-Identifier: Apache-2.0
 
-try:
-    from lxml import etree
-except ImportError:
-    from xml.etree import ElementTree as etree
+from collections import namedtuple
+from html import escape
+from io import BytesIO
+from xml.parsers import expat
 
-from junitparser import Error, Failure, JUnitXml
+from junitparser import JUnitXmlError
 
 from .warnings_checker import WarningsChecker
 
+RESULT_TAGS = ("failure", "error", "skipped")
+FAILING_RESULTS = ("failure", "error")
+
+CaseResult = namedtuple("CaseResult", ["classname", "name", "result", "message", "sourceline"])
+CaseResult.__doc__ = """Compact result of a test case: the tag and message of its result element, if any"""
+
+
+class CaseResultReader:
+    """Reads the results of the test cases of a JUnit XML document with expat, without building a tree
+
+    Only the attributes of the test cases and of their result elements are kept. No handler is set for character data,
+    so the text of e.g. ``system-out``, ``system-err`` and the body of a failure is never held in memory.
+
+    The test cases are the ones of the test suites in a ``testsuites`` root, or of a ``testsuite`` root.
+    Like ``JUnitXml`` of junitparser, a root with a tag that starts with ``testsuite`` is taken as the list of suites
+    when it has no test cases of its own.
+
+    A document that is still being written can be fed in parts. Each test case is available as soon as it has been
+    closed, except for the ones of nested suites in a ``testsuite`` root: a later test case of the root would exclude
+    them, so they are held back until the document is complete.
+    """
+
+    def __init__(self, keep_passed=False):
+        """Constructor
+
+        Args:
+            keep_passed (bool): True to keep the test cases without a failure or error as well
+        """
+        self.keep_passed = keep_passed
+        self.root_cases = []
+        self.suite_cases = []  # test cases of the nested suites, which count when the root has no test cases of its own
+        self.has_root_cases = False
+        self._path = []  # tags of the open elements
+        self._case = None  # classname, name, line and depth of the open test case, if it may count
+        self._results = {}  # result tag -> message of the open test case
+        self._taken = 0  # number of the test cases that count that have been returned by ``new_testcases``
+        self._parser = expat.ParserCreate()
+        self._parser.StartElementHandler = self._start
+        self._parser.EndElementHandler = self._end
+
+    @property
+    def testcases(self):
+        """list[CaseResult]: The results of the test cases that count, in document order"""
+        return self.root_cases if self.has_root_cases else self.suite_cases
+
+    def read(self, source):
+        """Reads a complete document
+
+        Args:
+            source (io.BufferedIOBase): The open XML file in binary mode
+
+        Returns:
+            list[CaseResult]: The results of the test cases that count, in document order
+
+        Raises:
+            xml.parsers.expat.ExpatError: The content is not well-formed XML
+            JUnitXmlError: A test case has more than one type of result
+        """
+        self._parser.ParseFile(source)
+        return self.testcases
+
+    def feed(self, data):
+        """Reads the next part of a document, which does not need to end at the boundary of an element
+
+        Args:
+            data (bytes/str): The next part of the XML document
+
+        Returns:
+            list[CaseResult]: The results of the test cases that have been completed since the previous call
+
+        Raises:
+            xml.parsers.expat.ExpatError: The content is not well-formed XML
+            JUnitXmlError: A test case has more than one type of result
+        """
+        self._parser.Parse(data, False)
+        return self.new_testcases()
+
+    def close(self):
+        """Ends the document that has been fed
+
+        Returns:
+            list[CaseResult]: The results of the test cases that have not been returned by ``feed`` yet
+
+        Raises:
+            xml.parsers.expat.ExpatError: The document is incomplete or not well-formed
+        """
+        self._parser.Parse(b"", True)
+        return self.new_testcases(complete=True)
+
+    def new_testcases(self, complete=False):
+        """Returns the results of the test cases that count and that have not been returned yet
+
+        Args:
+            complete (bool): True if no more test cases follow, e.g. after the end of the document or a parse error
+
+        Returns:
+            list[CaseResult]: The results of the test cases, in document order
+        """
+        if not (self.has_root_cases or complete or self._path[:1] == ["testsuites"]):
+            return []
+        testcases = self.testcases[self._taken:]
+        self._taken += len(testcases)
+        return testcases
+
+    def _start(self, tag, attributes):
+        depth = len(self._path)
+        if tag == "testcase" and depth in (1, 2):
+            if depth == 1:
+                self.has_root_cases = True
+                counts = self._path[0] == "testsuite"
+            else:
+                in_suite = self._path[1] == "testsuite" and self._path[0].startswith("testsuite")
+                counts = in_suite and not self.has_root_cases
+            if counts:
+                self._case = (attributes.get("classname"), attributes.get("name"), self._parser.CurrentLineNumber,
+                              depth)
+                self._results = {}
+        elif self._case is not None and tag in RESULT_TAGS and depth == self._case[3] + 1:
+            self._results.setdefault(tag, attributes.get("message"))
+        self._path.append(tag)
+
+    def _end(self, tag):
+        self._path.pop()
+        if self._case is None or tag != "testcase" or len(self._path) != self._case[3]:
+            return
+        classname, name, line, depth = self._case
+        self._case = None
+        if len(self._results) > 1:
+            raise JUnitXmlError("Only one result allowed per test case.")
+        result, message = next(iter(self._results.items()), (None, None))
+        if self.keep_passed or result in FAILING_RESULTS:
+            testcase = CaseResult(_escape(classname), _escape(name), result, _escape(message), line)
+            (self.root_cases if depth == 1 else self.suite_cases).append(testcase)
+
+
+def _escape(value):
+    """Returns the value of an attribute HTML-escaped like the attributes of junitparser, or None if it is missing"""
+    return escape(value) if value is not None else None
+
+
+def read_testcases(source, keep_passed=False):
+    """Reads the results of the test cases of a JUnit XML file, see ``CaseResultReader``
+
+    Args:
+        source (io.BufferedIOBase): The open XML file in binary mode
+        keep_passed (bool): True to return the test cases without a failure or error as well
+
+    Returns:
+        list[CaseResult]: The results of the test cases, in document order
+
+    Raises:
+        xml.parsers.expat.ExpatError: The content is not well-formed XML
+        JUnitXmlError: A test case has more than one type of result
+    """
+    return CaseResultReader(keep_passed).read(source)
+
+
+def read_file_testcases(path):
+    """Reads the failures and errors of the test cases of a JUnit XML file, e.g. in a worker process
+
+    Args:
+        path (str): Path to the JUnit XML file
+
+    Returns:
+        tuple[list[CaseResult], str/None]: The failures and errors of the test cases that have been completed, and
+            the message of the parse error (if any)
+    """
+    reader = CaseResultReader()
+    try:
+        with open(path, "rb") as file:
+            return reader.read(file), None
+    except expat.ExpatError as err:
+        return reader.new_testcases(complete=True), str(err)
+
 
 class JUnitChecker(WarningsChecker):
     name = "junit"
 
+    def __init__(self, *logging_args):
+        super().__init__(*logging_args)
+        self._reader = None  # of the document that is being fed
+        self._reader_failed = False
+
     def check(self, content):
         """Function for counting the number of JUnit failures in a specific text
 
         Args:
             content (str): The content to parse
         """
+        self.check_file(BytesIO(content.encode("utf-8")))
+
+    def check_file(self, file):
+        """Function for counting the number of JUnit failures in an open file, which is parsed while it is read
+
+        Of a file that is incomplete or not well-formed, the test cases that have been completed are counted.
+
+        Args:
+            file (io.IOBase): The open file to parse; of a file in text mode, the underlying binary file is read
+        """
+        reader = CaseResultReader(self.keep_passed)
         try:
-            root_input = etree.fromstring(content.encode("utf-8"))
-            testsuites_root = self.prepare_tree(root_input)
-            suites = JUnitXml.fromelem(testsuites_root)
-            amount_to_exclude = 0
-            for suite in suites:
-                for testcase in suite:
-                    amount_to_exclude += self._check_testcase(testcase)
-            suites.update_statistics()
-            self.count += suites.failures + suites.errors - amount_to_exclude
-        except etree.ParseError as err:
-            self.logger.error(err.msg)
+            reader.read(getattr(file, "buffer", file))
+        except expat.ExpatError as err:
+            self.check_testcase_results(reader.new_testcases(complete=True))
+            self.logger.error(str(err))
+            return
+        self.check_testcase_results(reader.testcases)
 
-    @property
-    def name_repr(self):
-        return "JUnit" if self.name == "junit" else super().name_repr
+    def feed(self, chunk):
+        """Function for counting the number of JUnit failures of the test cases that a chunk of the document completes
 
-    @staticmethod
-    def prepare_tree(root_input):
-        """Prepares the tree element by adding a testsuites element as root when missing (to please JUnitXml)
+        The failures are counted and reported while the document is being written, e.g. by a test run that is still
+        in progress. Each call continues where the previous one stopped.
 
         Args:
-            root_input (lxml.etree._Element/xml.etree.ElementTree.Element): Top-level XML element from input file
+            chunk (bytes/str): The next part of the XML document
+        """
+        if self._reader is None:
+            self._reader = CaseResultReader(self.keep_passed)
+        if self._reader_failed:
+            return
+        try:
+            self.check_testcase_results(self._reader.feed(chunk))
+        except expat.ExpatError as err:
+            self._reader_failed = True
+            self.check_testcase_results(self._reader.new_testcases(complete=True))
+            self.logger.error(str(err))
 
-        Returns:
-            lxml.etree._Element/xml.etree.ElementTree.Element: Top-level XML element with testsuites tag
+    def flush(self):
+        """Function for counting the number of JUnit failures of the remainder of the fed document
+
+        Of a document that is incomplete, the test cases that have been completed stay counted. The next chunk that is
+        fed starts a new document.
         """
-        if root_input.tag.startswith("testsuite") and root_input.find("testcase") is None:
-            testsuites_root = root_input
-        else:
-            testsuites_root = etree.Element("testsuites")
-            testsuites_root.append(root_input)
-        return testsuites_root
+        reader, failed = self._reader, self._reader_failed
+        self._reader, self._reader_failed = None, False
+        if reader is None or failed:
+            return
+        try:
+            self.check_testcase_results(reader.close())
+        except expat.ExpatError as err:
+            self.check_testcase_results(reader.new_testcases(complete=True))
+            self.logger.error(str(err))
+
+    def check_testcase_results(self, testcases):
+        """Function for counting the number of failures of test cases that have been read already
+
+        Args:
+            testcases (list[CaseResult]): Results of the test cases, e.g. of ``read_testcases``
+        """
+        amount_to_exclude = 0
+        for testcase in testcases:
+            amount_to_exclude += self._check_testcase(testcase)
+        self.count += sum(testcase.result in FAILING_RESULTS for testcase in testcases) - amount_to_exclude
+
+    @property
+    def keep_passed(self):
+        """bool: True if ``_check_testcase`` needs the test cases without a failure or error as well"""
+        return False
+
+    @property
+    def name_repr(self):
+        return "JUnit" if self.name == "junit" else super().name_repr
 
     def _check_testcase(self, testcase):
         """Handles the check of a test case element by checking if the result is a failure/error.
@@ -61,14 +281,20 @@ class JUnitChecker(WarningsChecker):
         In output mode, the failure/error message is written additionally.
 
         Args:
-            testcase (junitparser.TestCase): Test case element to check for failure or error
+            testcase (CaseResult): Result of the test case to check for failure or error
 
         Returns:
             int: 1 if a failure/error is to be subtracted from the final count, 0 otherwise
         """
-        if isinstance(testcase.result, (Failure, Error)):
-            if self._is_excluded(testcase.result.message):
+        if testcase.result in FAILING_RESULTS:
+            if self._is_excluded(testcase.message):
+                return 1
+            if self.field_exclusions and self._is_field_excluded(
+                    testcase.message, {"classname": testcase.classname, "name": testcase.name}.get):
                 return 1
             self.logger.info(f"{testcase.classname}.{testcase.name}")
-            self.logger.debug(f"{testcase.classname}.{testcase.name} | {testcase.result.message}")
+            self.logger.debug(f"{testcase.classname}.{testcase.name} | {testcase.message}")
+            if self.jsonl_writer:
+                self.write_jsonl_record(f"{testcase.classname}.{testcase.name}",
+                                        log_line=testcase.sourceline)
         return 0
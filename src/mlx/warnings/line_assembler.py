@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Assembly of streamed chunks of text into blocks of complete lines for regex checkers"""
+
+
+class LineAssembler:
+    """Turns chunks of text into blocks of complete lines without splitting a multi-line warning
+
+    A line that matches the continuation pattern may belong to the warning on one of the previous lines. Such lines are
+    held back, together with the last line that is no continuation, until a line arrives that cannot be a continuation.
+    The amount of lines that are held back is limited to ``max_lines``.
+    """
+
+    def __init__(self, continuation_pattern=None, max_lines=256):
+        """Constructor
+
+        Args:
+            continuation_pattern (re.Pattern/None): Pattern that matches the start of a line that may continue a
+                warning; None when warnings never span multiple lines
+            max_lines (int): Maximum number of lines to hold back while waiting for the end of a warning
+        """
+        self.continuation_pattern = continuation_pattern
+        self.max_lines = max_lines
+        self._lines = []
+        self._partial_line = ""
+
+    def feed(self, chunk):
+        """Adds a chunk of text
+
+        Args:
+            chunk (str): The next chunk of text, which doesn't need to end on a line boundary
+
+        Returns:
+            str: The block of complete lines that can be parsed, possibly empty
+        """
+        lines = (self._partial_line + chunk).split("\n")
+        self._partial_line = lines.pop()
+        self._lines.extend(lines)
+        split_index = len(self._lines)
+        if self.continuation_pattern is not None:
+            first_index = max(split_index - self.max_lines, 0)
+            for index in range(split_index - 1, first_index - 1, -1):
+                if not self.continuation_pattern.match(self._lines[index]):
+                    split_index = index
+                    break
+            else:
+                if first_index == 0:
+                    split_index = 0  # the window is not full yet: keep waiting for the end of the warning
+        return self._pop_block(split_index)
+
+    def flush(self):
+        """Returns all text that has been held back, as the end of the input has been reached
+
+        Returns:
+            str: The remaining text, possibly empty
+        """
+        block = self._pop_block(len(self._lines)) + self._partial_line
+        self._partial_line = ""
+        return block
+
+    def _pop_block(self, split_index):
+        """Removes the lines before the given index and returns them as a block of text"""
+        if not split_index:
+            return ""
+        block = "\n".join(self._lines[:split_index]) + "\n"
+        del self._lines[:split_index]
+        return block
@@ -0,0 +1,158 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Background writer for the output file that is shared by all checkers"""
+
+import atexit
+import json
+import logging
+import os
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue
+
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+_writers = {}
+_jsonl_writers = {}
+
+
+class BufferedFileHandler(logging.Handler):
+    """Handler that appends records to a file through a large buffer instead of flushing every record"""
+
+    def __init__(self, path, buffer_size=OUTPUT_BUFFER_SIZE):
+        """Constructor
+
+        Args:
+            path (Path/str): The path to the output file
+            buffer_size (int): Size of the write buffer in bytes
+        """
+        super().__init__()
+        self.stream = open(path, "a", buffering=buffer_size)
+
+    def emit(self, record):
+        try:
+            self.stream.write(f"{self.format(record)}\n")
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        with self.lock:
+            if not self.stream.closed:
+                self.stream.flush()
+
+    def close(self):
+        with self.lock:
+            self.stream.close()
+        super().close()
+
+
+def output_handler(output):
+    """Creates a handler that passes records to the single writer thread of the given output file
+
+    The writer thread is started for the first handler of an output file. All handlers of the same file share one
+    queue, so the records end up in the file in the order in which they were logged. The records are written through a
+    large buffer: the file is only complete after ``flush_output`` or ``close_output``.
+
+    Args:
+        output (Path/str): The path to the output file
+
+    Returns:
+        logging.handlers.QueueHandler: Handler to add to the logger of a checker
+    """
+    key = os.path.abspath(output)
+    if key not in _writers:
+        listener = QueueListener(Queue(), BufferedFileHandler(output))
+        listener.start()
+        _writers[key] = listener
+    return QueueHandler(_writers[key].queue)
+
+
+class JsonLinesWriter:
+    """Writes one JSON object per counted warning to a file, as soon as the warning has been found"""
+
+    def __init__(self, path, buffer_size=OUTPUT_BUFFER_SIZE):
+        """Constructor
+
+        Args:
+            path (Path/str): The path to the JSON Lines file
+            buffer_size (int): Size of the write buffer in bytes
+        """
+        self.stream = open(path, "w", encoding="utf-8", newline="\n", buffering=buffer_size)
+        self.source = None  # name of the log that is being checked
+
+    def write(self, checker, sub_checker, description, path=None, line=None, severity=None, log_line=None):
+        """Writes the record of a counted warning
+
+        Args:
+            checker (str): Name of the checker
+            sub_checker (str/None): Name of the sub-checker, None if the checker has no sub-checkers
+            description (str): Description of the warning
+            path (str/None): Path to the file the warning is about
+            line (str/int/None): Line number in that file
+            severity (str/None): Code Quality severity of the warning
+            log_line (int/None): Number of the line in the log where the warning starts
+        """
+        try:
+            line = int(line)
+        except (TypeError, ValueError):
+            line = None
+        record = {
+            "checker": checker,
+            "sub_checker": sub_checker,
+            "path": path,
+            "line": line,
+            "severity": severity,
+            "description": description,
+            "source": self.source,
+            "log_line": log_line,
+        }
+        self.stream.write(f"{json.dumps(record)}\n")
+
+    def close(self):
+        self.stream.close()
+
+
+def jsonl_writer(path):
+    """Returns the writer of the given JSON Lines file, which is shared by all checkers
+
+    Args:
+        path (Path/str): The path to the JSON Lines file
+
+    Returns:
+        JsonLinesWriter: The writer of the file
+    """
+    key = os.path.abspath(path)
+    if key not in _jsonl_writers:
+        _jsonl_writers[key] = JsonLinesWriter(path)
+    return _jsonl_writers[key]
+
+
+def flush_output():
+    """Writes the records that have been logged so far to the output files
+
+    The writer threads are stopped after they have handled all queued records, and started again once the files have
+    been flushed.
+    """
+    for listener in _writers.values():
+        listener.stop()
+        for handler in listener.handlers:
+            handler.flush()
+        listener.start()
+    for writer in _jsonl_writers.values():
+        writer.stream.flush()
+
+
+@atexit.register
+def close_output():
+    """Stops the writer threads after they have handled all queued records and closes the output files
+
+    The JSON Lines files are closed as well. This is called at the end of a run and at exit; the next handler of an
+    output file starts a new writer thread.
+    """
+    for listener in _writers.values():
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+    _writers.clear()
+    for writer in _jsonl_writers.values():
+        writer.close()
+    _jsonl_writers.clear()
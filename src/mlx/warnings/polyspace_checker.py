@@ -7,7 +7,7 @@ from string import Template
 
 from .code_quality import Finding
 from .exceptions import WarningsConfigError
-from .warnings_checker import WarningsChecker
+from .warnings_checker import NON_LIMIT_KEYS, WarningsChecker
 
 
 class PolyspaceChecker(WarningsChecker):
@@ -85,7 +85,7 @@ class PolyspaceChecker(WarningsChecker):
         for row in reader:
             for checker in self.checkers:
                 if row["family"].lower() == checker.family_value:
-                    checker.check(row)
+                    checker.check(row, reader.line_num)
 
     def return_count(self):
         """Getter function for the amount of warnings found
@@ -98,6 +98,11 @@ class PolyspaceChecker(WarningsChecker):
             self.count += checker.return_count()
         return self.count
 
+    def log_exclusion_cache_info(self):
+        """Logs the statistics of the caches of exclusion decisions of the sub-checkers in verbose mode"""
+        for checker in self.checkers:
+            checker.log_exclusion_cache_info()
+
     def return_check_limits(self):
         """Function for checking whether the warning count is within the configured limits
 
@@ -112,6 +117,43 @@ class PolyspaceChecker(WarningsChecker):
             self.logger.warning(f"Returning error code {count}.")
         return count
 
+    def apply_limits(self, config):
+        """Replaces the limits of all checks by the ones of the given configuration, e.g. of a limit profile
+
+        Checks that are not in the configuration get a minimum and maximum of 0.
+
+        Args:
+            config (dict): Configuration with a list of checks per family, like the checker configuration
+
+        Raises:
+            WarningsConfigError: The configuration contains a check that has not been configured for the checker
+        """
+        limits = {}
+        for family_value, data in config.items():
+            if family_value in NON_LIMIT_KEYS:
+                continue
+            for check in data:
+                for key, value in check.items():
+                    if key not in ["min", "max"]:
+                        limits[(family_value, key.lower(), value.lower())] = check
+        checks = {(checker.family_value, checker.column_name, checker.check_value): checker
+                  for checker in self.checkers}
+        for key in limits:
+            if key not in checks:
+                raise WarningsConfigError(f"Check {key[1]!r}: {key[2]!r} of family {key[0]!r} has not been configured "
+                                          "for the Polyspace checker")
+        for key, checker in checks.items():
+            checker.apply_limits(limits.get(key, {"min": 0, "max": 0}))
+
+    def save_limits(self):
+        return super().save_limits(), [checker.save_limits() for checker in self.checkers]
+
+    def restore_limits(self, limits):
+        limits, limits_per_check = limits
+        super().restore_limits(limits)
+        for checker, checker_limits in zip(self.checkers, limits_per_check):
+            checker.restore_limits(checker_limits)
+
     def parse_config(self, config):
         """Parsing configuration dict extracted by previously opened JSON or yaml/yml file
 
@@ -137,6 +179,11 @@ class PolyspaceChecker(WarningsChecker):
             if family_value == "exclude":
                 self.add_patterns(config.get("exclude"), self.exclude_patterns)
                 continue
+            if family_value == "exclude_fields":
+                self.add_field_exclusions(config.get("exclude_fields"), config.get("exclude_fields_root"))
+                continue
+            if family_value == "exclude_fields_root":
+                continue
             for check in data:
                 for key, value in check.items():
                     if key in ["min", "max"]:
@@ -157,6 +204,7 @@ class PolyspaceChecker(WarningsChecker):
         for checker in self.checkers:
             checker.cq_enabled = self.cq_enabled
             checker.exclude_patterns = self.exclude_patterns
+            checker.field_exclusions = self.field_exclusions
             checker.cq_description_template = self.cq_description_template
             checker.cq_default_path = self.cq_default_path
 
@@ -185,6 +233,11 @@ class PolyspaceFamilyChecker(WarningsChecker):
         self.column_name = column_name
         self.check_value = check_value
 
+    @property
+    def sub_checker_name(self):
+        """str: The family, column and value to check, e.g. ``defect: impact: high``"""
+        return f"{self.family_value}: {self.column_name}: {self.check_value}"
+
     @property
     def cq_description_template(self):
         """Template: string.Template instance based on the configured template string"""
@@ -218,12 +271,13 @@ class PolyspaceFamilyChecker(WarningsChecker):
 
         self.cq_findings.append(finding.to_dict())
 
-    def check(self, content):
+    def check(self, content, log_line=None):
         """
         Function for counting the number of failures in a TSV/CSV file exported by Polyspace
 
         Args:
             content (dict): The row of the TSV file
+            log_line (int/None): Number of the line of the row in the TSV file, for the JSON Lines output
         """
         if content[self.column_name].lower() == self.check_value:
             if content["status"].lower() in ["not a defect", "justified"]:
@@ -232,10 +286,24 @@ class PolyspaceFamilyChecker(WarningsChecker):
             else:
                 valid_content_values = [item or "" for item in content.values()]
                 tab_sep_string = "\t".join(valid_content_values)
-                if not self._is_excluded(tab_sep_string):
+                if not (self._is_excluded(tab_sep_string) or self._is_field_excluded(tab_sep_string, content.get)):
                     self.count = self.count + 1
                     verbose_log_msg = f"ID {content.get('id', None)!r}"
                     self.logger.info(verbose_log_msg)
                     self.logger.debug(verbose_log_msg)
                     if self.cq_enabled and content["color"].lower() != "green":
                         self.add_code_quality_finding(content)
+                    if self.jsonl_writer:
+                        self.add_jsonl_record(content, log_line)
+
+    def add_jsonl_record(self, row, log_line):
+        """Writes the JSON Lines record of a counted defect
+
+        Args:
+            row (dict): The row of the defect with the corresponding column names
+            log_line (int/None): Number of the line of the row in the TSV file
+        """
+        severity = self.code_quality_severity.get(row["information"].lower(),
+                                                  self.code_quality_severity.get(row["color"].lower()))
+        self.write_jsonl_record(f"ID {row.get('id', None)!r}: {row.get('check', '')}", path=row.get("file"),
+                                line=row.get("line"), severity=severity, log_line=log_line)
@@ -1,10 +1,16 @@
+import hashlib
+import logging
 import os
 import re
+from functools import lru_cache
+from math import inf
 from string import Template
 
 from .code_quality import Finding
 from .exceptions import WarningsConfigError
-from .warnings_checker import WarningsChecker
+from .line_assembler import LineAssembler
+from .warnings_checker import NON_LIMIT_KEYS, WarningsChecker, substitute_envvar
+
 
 DOXYGEN_WARNING_REGEX = r"(?:(?P<path1>(?:[/.]|[A-Za-z]).+?):(?P<line1>-?\d+):\s*(?P<severity1>[Ww]arning|[Ee]rror)|<.+>:(?P<line2>-?\d+)(?::\s*(?P<severity2>[Ww]arning|[Ee]rror))?): (?P<description1>.+(?:(?!\s*([Nn]otice|[Ww]arning|[Ee]rror): )[^/<\n][^:\n][^/\n].+)*)|\s*\b(?P<severity3>[Nn]otice|[Ww]arning|[Ee]rror): (?!notes)(?P<description2>.+)\n?"
 doxy_pattern = re.compile(DOXYGEN_WARNING_REGEX)
@@ -19,9 +25,78 @@ COVERITY_WARNING_REGEX = r"(?P<path>[\w\.\\/\- ]+)(:(?P<line>\d+)(:(?P<column>\d
 coverity_pattern = re.compile(COVERITY_WARNING_REGEX)
 
 
+CQ_FIELDS = ("description", "severity", "path", "line")
+
+
+@lru_cache(maxsize=None)
+def group_indices(pattern, field):
+    """Returns the indices of the named groups of the pattern that start with the name of the field
+
+    Args:
+        pattern (re.Pattern): The compiled regular expression
+        field (str): The name of the field
+
+    Returns:
+        tuple[int]: Group indices in order of appearance in the pattern
+    """
+    return tuple(index for name, index in sorted(pattern.groupindex.items(), key=lambda item: item[1])
+                 if name.startswith(field))
+
+
+def field_group_indices(pattern):
+    """Returns, for each Code Quality field, the indices of the named groups of the pattern that start with its name
+
+    Args:
+        pattern (re.Pattern): The compiled regular expression
+
+    Returns:
+        tuple[tuple[int]]: Group indices per field of ``CQ_FIELDS``, in order of appearance in the pattern
+    """
+    return tuple(group_indices(pattern, field) for field in CQ_FIELDS)
+
+
+def first_group(match, indices):
+    """Returns the value of the first group with one of the given indices that matched a non-empty string"""
+    for index in indices:
+        if result := match.group(index):
+            return result
+    return None
+
+
+class CachedMatch:
+    """Values of the groups and start of a regex match, which a match cache keeps instead of the ``re.Match``
+
+    It offers the part of the interface of ``re.Match`` that the checkers use.
+    """
+    __slots__ = ("re", "_groups", "_start")
+
+    def __init__(self, match):
+        """Constructor
+
+        Args:
+            match (re.Match): The regex match
+        """
+        self.re = match.re
+        self._groups = (match.group(0), *match.groups())
+        self._start = match.start()
+
+    def group(self, group=0):
+        """Returns the value of a group by its index or name"""
+        return self._groups[self.re.groupindex[group] if isinstance(group, str) else group]
+
+    def groupdict(self):
+        """Returns the values of the named groups by their name"""
+        return {name: self._groups[index] for name, index in self.re.groupindex.items()}
+
+    def start(self):
+        """Returns the index in the content at which the match starts"""
+        return self._start
+
+
 class RegexChecker(WarningsChecker):
     name = "regex"
     pattern = None
+    continuation_pattern = None
     SEVERITY_MAP = {
         "debug": "info",
         "info": "info",
@@ -32,6 +107,244 @@ class RegexChecker(WarningsChecker):
         "critical": "critical",
         "failed": "critical",
     }
+    SEVERITY_LEVELS = {
+        "debug": 0,
+        "info": 1,
+        "notice": 1,
+        "warning": 2,
+        "error": 3,
+        "failed": 3,
+        "severe": 4,
+        "critical": 5,
+    }
+
+    def __init__(self, *logging_args):
+        super().__init__(*logging_args)
+        self.unique = False
+        self._digests = set()
+        self.min_severity_level = 0
+        self._severity_filter_level = 0
+        self.max_multiline_lines = 256
+        self._line_assembler = None
+        self.group_by = None
+        self.group_limits = {}
+        self.group_counts = {}
+        self.match_cache = None
+
+    def parse_config(self, config):
+        """Process configuration
+
+        Args:
+            config (dict): Content of configuration file
+        """
+        super().parse_config(config)
+        self.unique = bool(config.get("unique", False))
+        if "min_severity" in config:
+            self.set_min_severity(config["min_severity"])
+        if "max_multiline_lines" in config:
+            self.max_multiline_lines = int(config["max_multiline_lines"])
+
+    def apply_limits(self, config):
+        """Replaces the limits, including the ones per value of ``group_by``, by the ones of the given configuration
+
+        Args:
+            config (dict): Configuration with a ``min``, ``max`` and optionally ``group_by``
+        """
+        super().apply_limits(config)
+        self.group_limits = {}
+        if "group_by" in config:
+            self.set_group_limits(config["group_by"])
+
+    def save_limits(self):
+        return super().save_limits(), self.group_by, self.group_limits
+
+    def restore_limits(self, limits):
+        limits, self.group_by, self.group_limits = limits
+        super().restore_limits(limits)
+
+    def set_group_limits(self, config):
+        """Configures limits per value of a field of the warnings, e.g. per severity
+
+        Args:
+            config (dict): Name of the ``field`` to group by and the ``limits`` with a ``min`` and/or ``max`` per value;
+                a missing ``min`` defaults to 0, a missing ``max`` or -1 means no maximum
+
+        Raises:
+            WarningsConfigError: The field is not in the regex or the limits are invalid
+        """
+        try:
+            field = config["field"]
+            limits = config.get("limits", {})
+        except (KeyError, TypeError, AttributeError):
+            raise WarningsConfigError(f"Expected a mapping with a 'field' and 'limits' for 'group_by' of checker "
+                                      f"{self.name!r}; got {config!r}") from None
+        if field not in CQ_FIELDS and not group_indices(self.pattern, field):
+            raise WarningsConfigError(f"Cannot group warnings of checker {self.name!r} by {field!r}: the regex has no "
+                                      f"named group for it")
+        if self.group_by is not None and field != self.group_by:
+            raise WarningsConfigError(f"Cannot group warnings of checker {self.name!r} by {field!r}: they are "
+                                      f"grouped by {self.group_by!r} already")
+        self.group_by = field
+        self.group_limits = {}
+        for value, value_config in limits.items():
+            substitute_envvar(value_config, {"min", "max"})
+            minimum = int(value_config.get("min", 0))
+            maximum = int(value_config.get("max", -1))
+            if maximum == -1:
+                maximum = inf
+            if minimum > maximum:
+                raise WarningsConfigError(f"Invalid limits for {field} {value!r} of checker {self.name!r}: minimum "
+                                          f"{minimum} is higher than maximum {maximum}")
+            self.group_limits[str(value)] = (minimum, maximum)
+
+    def _count_group(self, match):
+        """Increments the counter of the value of the ``group_by`` field of the match; values are case-insensitive
+
+        Args:
+            match (re.Match): The regex match of a counted warning
+        """
+        value = self.field_value(match, self.group_by)
+        key = value.lower() if value else ""
+        self.group_counts[key] = self.group_counts.get(key, 0) + 1
+
+    def _return_group_error_code(self):
+        """Checks the count of each value of the ``group_by`` field that has limits
+
+        Returns:
+            int: The sum of the counts of the values that are not within limits (1 for a count of 0)
+        """
+        error_code = 0
+        for value, (minimum, maximum) in self.group_limits.items():
+            count = self.group_counts.get(value.lower(), 0)
+            if count > maximum:
+                error_reason = f"higher than the maximum limit ({maximum})"
+            elif count < minimum:
+                error_reason = f"lower than the minimum limit ({minimum})"
+            else:
+                continue
+            self.logger.warning(f"{self.group_by} {value!r}: number of warnings ({count}) is {error_reason}.")
+            error_code += count or 1
+        return error_code
+
+    def return_check_limits(self):
+        """Function for checking whether the warning count, and the count per value of ``group_by``, is within the
+        configured limits
+
+        Returns:
+            int: 0 if the amounts of warnings are within limits, the sum of the counts that are not otherwise
+                (with 1 for each count of 0 warnings)
+        """
+        group_error_code = self._return_group_error_code()
+        if not group_error_code:
+            return super().return_check_limits()
+        error_code = group_error_code
+        if self.count > self._maximum:
+            self.logger.warning(f"number of warnings ({self.count}) is higher than the maximum limit "
+                                f"({self._maximum}).")
+            error_code += self.count
+        elif self.count < self._minimum:
+            self.logger.warning(f"number of warnings ({self.count}) is lower than the minimum limit "
+                                f"({self._minimum}).")
+            error_code += self.count or 1
+        self.logger.warning(f"Returning error code {error_code}.")
+        return error_code
+
+    def set_min_severity(self, severity):
+        """Configures the lowest severity of the warnings to count; warnings with a lower severity are ignored
+
+        Args:
+            severity (str): The minimum severity, e.g. ``"warning"``
+
+        Raises:
+            WarningsConfigError: Unknown severity
+        """
+        try:
+            self.min_severity_level = self.SEVERITY_LEVELS[str(severity).lower()]
+        except KeyError:
+            raise WarningsConfigError(f"Invalid value {severity!r} for 'min_severity' of checker {self.name!r}; "
+                                      f"expected one of {list(self.SEVERITY_LEVELS)}") from None
+        self._severity_filter_level = self.min_severity_level
+
+    def _is_below_min_severity(self, match):
+        """Checks if the severity of the match is lower than the configured minimum severity
+
+        A match without severity, or with a severity that is not in ``SEVERITY_LEVELS``, is never ignored.
+
+        Args:
+            match (re.Match): The regex match
+
+        Returns:
+            bool: True if the match must be ignored, False otherwise
+        """
+        severity = first_group(match, self.field_groups[1])
+        return bool(severity) and self.SEVERITY_LEVELS.get(severity.lower(), inf) < self.min_severity_level
+
+    @property
+    def is_count_only(self):
+        """bool: True when matches only need to be counted: nothing is logged, excluded, filtered or reported"""
+        reported = self.cq_enabled or self.jsonl_writer or self.group_by or self.logger.isEnabledFor(logging.INFO)
+        filtered = self.exclude_patterns or self.field_exclusions or self.unique or self._severity_filter_level
+        return not (reported or filtered)
+
+    def _is_duplicate(self, content):
+        """Checks if an identical warning has been counted before; whitespace differences are ignored
+
+        Only a fixed-size digest of each distinct warning is kept in memory.
+
+        Args:
+            content (str): The matched warning
+
+        Returns:
+            bool: True if the warning is a duplicate, False if it is seen for the first time
+        """
+        digest = hashlib.blake2b(" ".join(content.split()).encode("utf-8"), digest_size=16).digest()
+        if digest in self._digests:
+            return True
+        self._digests.add(digest)
+        return False
+
+    def find_matches(self, content):
+        """Returns the matches of the pattern in the content
+
+        When a match cache is set, which belongs to one content, the matches of each pattern are looked up in it, so
+        that checkers with the same pattern search the content only once. The cache keeps the values of the groups of
+        each match instead of the match itself.
+
+        Args:
+            content (str): The content to search
+
+        Returns:
+            Iterable[re.Match|CachedMatch]: The matches in order of appearance
+        """
+        if self.match_cache is None:
+            return self.pattern.finditer(content)
+        if (matches := self.match_cache.get(self.pattern)) is None:
+            matches = self.match_cache[self.pattern] = [CachedMatch(match) for match in self.pattern.finditer(content)]
+        return matches
+
+    def feed(self, chunk):
+        """Function for counting the number of warnings in a stream of text, one chunk at a time
+
+        The chunks are assembled into blocks of complete lines. For a checker with a continuation pattern, lines that
+        may continue a multi-line warning are held back, up to ``max_multiline_lines`` lines.
+
+        Args:
+            chunk (str): The next chunk of the content to parse
+        """
+        if self._line_assembler is None:
+            self._line_assembler = LineAssembler(self.continuation_pattern, self.max_multiline_lines)
+        if block := self._line_assembler.feed(chunk):
+            self.check(block)
+            if self.jsonl_writer:
+                self._log_line_offset += block.count("\n")
+
+    def flush(self):
+        """Function for counting the number of warnings in the remainder of the streamed content"""
+        if self._line_assembler is not None:
+            if block := self._line_assembler.flush():
+                self.check(block)
+            self._line_assembler = None
+            self._log_line_offset = 0
 
     def check(self, content):
         """Function for counting the number of warnings in a specific text
@@ -39,16 +352,50 @@ class RegexChecker(WarningsChecker):
         Args:
             content (str): The content to parse
         """
-        matches = re.finditer(self.pattern, content)
+        if self.is_count_only:
+            self.count += sum(1 for _ in self.find_matches(content))
+            return
+        log_line = self._log_line_counter(content) if self.jsonl_writer else None
+        matches = self.find_matches(content)
         for match in matches:
+            if self._severity_filter_level and self._is_below_min_severity(match):
+                continue
             match_string = match.group(0).strip()
             if self._is_excluded(match_string):
                 continue
+            if self.field_exclusions and self._is_field_excluded(match_string,
+                                                                 lambda field: self.field_value(match, field)):
+                continue
+            if self.unique and self._is_duplicate(match_string):
+                continue
             self.count += 1
+            if self.group_by:
+                self._count_group(match)
             self.logger.info(match_string)
             self.logger.debug(match_string)
             if self.cq_enabled:
                 self.add_code_quality_finding(match)
+            if self.jsonl_writer:
+                self.add_jsonl_record(match, log_line(match.start()))
+
+    @property
+    def field_groups(self):
+        """tuple[tuple[int]]: Group indices of the pattern per Code Quality field, see ``field_group_indices``"""
+        return field_group_indices(self.pattern)
+
+    def field_value(self, match, field):
+        """Returns the value of a field of the match
+
+        Args:
+            match (re.Match): The regex match
+            field (str): Name of the field, which is a Code Quality field or the (prefix of the) name of a group
+
+        Returns:
+            str/None: The value of the first group of the field that matched a non-empty string
+        """
+        if field in CQ_FIELDS:
+            return first_group(match, self.field_groups[CQ_FIELDS.index(field)])
+        return first_group(match, group_indices(self.pattern, field))
 
     def add_code_quality_finding(self, match):
         """Add code quality finding
@@ -56,28 +403,102 @@ class RegexChecker(WarningsChecker):
         Args:
             match (re.Match): The regex match
         """
-        groups = {name: result for name, result in match.groupdict().items() if result}
-
-        description = next((result for name, result in groups.items() if name.startswith("description")), None)
+        description_groups, severity_groups, path_groups, line_groups = self.field_groups
+        description = first_group(match, description_groups)
         if not description:
             return  # No description was found, which is the bare minimum
 
         finding = Finding(self.cq_description_template.substitute(description=description))
-        finding.severity = next((self.SEVERITY_MAP[result.lower()] for name, result in groups.items()
-                                 if name.startswith("severity")), "info")
-        finding.path = next((result for name, result in groups.items()
-                             if name.startswith("path")), self.cq_default_path)
-        finding.line = next((result for name, result in groups.items() if name.startswith("line")), 1)
+        severity = first_group(match, severity_groups)
+        finding.severity = self.SEVERITY_MAP.get(severity.lower(), "info") if severity else "info"
+        finding.path = first_group(match, path_groups) or self.cq_default_path
+        finding.line = first_group(match, line_groups) or 1
         self.cq_findings.append(finding.to_dict())
 
+    def add_jsonl_record(self, match, log_line):
+        """Writes the JSON Lines record of a counted warning
+
+        Args:
+            match (re.Match): The regex match
+            log_line (int): Number of the line in the log where the match starts
+        """
+        description_groups, severity_groups, path_groups, line_groups = self.field_groups
+        severity = first_group(match, severity_groups)
+        self.write_jsonl_record(first_group(match, description_groups) or match.group(0).strip(),
+                                path=first_group(match, path_groups),
+                                line=first_group(match, line_groups),
+                                severity=self.SEVERITY_MAP.get(severity.lower(), "info") if severity else None,
+                                log_line=log_line)
+
+
+class CustomRegexChecker(RegexChecker):
+    """Regex checker of which the name, pattern and Code Quality mapping are defined in the configuration file"""
+
+    def __init__(self, name, *logging_args):
+        """Constructor
+
+        Args:
+            name (str): Name of the checker, as defined in the configuration file
+        """
+        self.name = name
+        super().__init__(*logging_args)
+        self.SEVERITY_MAP = dict(RegexChecker.SEVERITY_MAP)
+        self._field_groups = ()
+
+    @property
+    def field_groups(self):
+        """tuple[tuple[int]]: Group indices of the pattern per Code Quality field
+
+        A field that is mapped to a named group in the configuration uses that group only; other fields fall back to
+        the named groups that start with the name of the field.
+        """
+        return self._field_groups
+
+    def parse_config(self, config):
+        """Process configuration
+
+        Args:
+            config (dict): Configuration of the custom checker
+
+        Raises:
+            WarningsConfigError: Invalid pattern, group name or severity
+        """
+        try:
+            self.pattern = re.compile(config["pattern"])
+        except (re.error, TypeError) as err:
+            raise WarningsConfigError(f"Invalid pattern for custom checker {self.name!r}: {err}") from None
+        self.guard_pattern(self.pattern)
+        if "continuation" in config:
+            try:
+                self.continuation_pattern = re.compile(config["continuation"])
+            except (re.error, TypeError) as err:
+                raise WarningsConfigError(f"Invalid continuation pattern for custom checker {self.name!r}: "
+                                          f"{err}") from None
+            self.guard_pattern(self.continuation_pattern)
+        field_groups = list(field_group_indices(self.pattern))
+        for field, group_name in config.get("fields", {}).items():
+            if field not in CQ_FIELDS:
+                raise WarningsConfigError(f"Unknown field {field!r} for custom checker {self.name!r}; expected one "
+                                          f"of {list(CQ_FIELDS)}")
+            if group_name not in self.pattern.groupindex:
+                raise WarningsConfigError(f"Custom checker {self.name!r} maps field {field!r} to group "
+                                          f"{group_name!r}, which does not exist in its pattern")
+            field_groups[CQ_FIELDS.index(field)] = (self.pattern.groupindex[group_name],)
+        self._field_groups = tuple(field_groups)
+        for value, severity in config.get("severity_map", {}).items():
+            if severity not in Finding.SEVERITIES:
+                raise WarningsConfigError(f"Custom checker {self.name!r} maps severity {value!r} to {severity!r}; "
+                                          f"expected one of {list(Finding.SEVERITIES)}")
+            self.SEVERITY_MAP[str(value).lower()] = severity
+        super().parse_config(config)
+
 
 class CoverityChecker(RegexChecker):
     name = "coverity"
     pattern = coverity_pattern
 
     def __init__(self, *logging_args):
-        super().__init__(*logging_args)
-        self._cq_description_template = Template("Coverity: CID $cid: $checker")
+        # the sub-checkers exist before the base class sets the attributes that get passed on to them
         self.checkers = {
             "unclassified": CoverityClassificationChecker("unclassified", *logging_args),
             "pending": CoverityClassificationChecker("pending", *logging_args),
@@ -85,6 +506,17 @@ class CoverityChecker(RegexChecker):
             "intentional": CoverityClassificationChecker("intentional", *logging_args),
             "false positive": CoverityClassificationChecker("false positive", *logging_args),
         }
+        self._dispatch = {
+            spelling: checker
+            for classification, checker in self.checkers.items()
+            for spelling in (classification, classification.capitalize(), classification.title(),
+                             classification.upper())
+        }
+        super().__init__(*logging_args)
+        self.cq_description_template = Template("Coverity: CID $cid: $checker")
+        self._pending_defects = {}  # CID -> CoverityDefect of which the last event has not been seen yet
+        self._emitted_cids = set()  # CIDs of the defects that got reported
+        self._emitted_findings = {}  # CID -> Code Quality finding of a defect that got reported
 
     @property
     def cq_findings(self):
@@ -101,6 +533,67 @@ class CoverityChecker(RegexChecker):
     @cq_description_template.setter
     def cq_description_template(self, template_obj):
         self._cq_description_template = template_obj
+        for checker in self.checkers.values():
+            checker.cq_description_template = template_obj
+
+    @property
+    def cq_enabled(self):
+        """bool: True to generate Code Quality findings; passed on to the sub-checkers"""
+        return self._cq_enabled
+
+    @cq_enabled.setter
+    def cq_enabled(self, value):
+        self._cq_enabled = value
+        for checker in self.checkers.values():
+            checker.cq_enabled = value
+
+    @property
+    def cq_default_path(self):
+        """str: Path for Code Quality findings without path; passed on to the sub-checkers"""
+        return self._cq_default_path
+
+    @cq_default_path.setter
+    def cq_default_path(self, value):
+        self._cq_default_path = value
+        for checker in self.checkers.values():
+            checker.cq_default_path = value
+
+    @property
+    def exclude_patterns(self):
+        """List[re.Pattern]: patterns to exclude matches with; each sub-checker gets a copy, to which the patterns of
+        its classification are added
+        """
+        return self._exclude_patterns
+
+    @exclude_patterns.setter
+    def exclude_patterns(self, value):
+        self._exclude_patterns = value
+        for checker in self.checkers.values():
+            checker.exclude_patterns = list(value)
+
+    @property
+    def field_exclusions(self):
+        """dict: GlobIndex per field to exclude matches with; each sub-checker gets a copy, to which the globs of its
+        classification are added
+        """
+        return self._field_exclusions
+
+    @field_exclusions.setter
+    def field_exclusions(self, value):
+        self._field_exclusions = value
+        for checker in self.checkers.values():
+            checker.field_exclusions = dict(value)
+
+    def add_field_exclusions(self, globs_per_field, root=None):
+        """Adds globs to exclude matches based on the value of a specific field, for all classifications
+
+        Args:
+            globs_per_field (dict|None): Mapping of a field name to a list of globs
+            root (str|None): Directory that anchored globs of a path field are relative to
+        """
+        super().add_field_exclusions(globs_per_field, root)
+        for checker in self.checkers.values():
+            checker.add_field_exclusions(globs_per_field, root)
 
     def return_count(self):
         """Getter function for the amount of warnings found
@@ -123,29 +616,113 @@ class CoverityChecker(RegexChecker):
         count = 0
         for checker in self.checkers.values():
             count += checker.return_check_limits()
+        count += self._return_group_error_code()
         if count:
             self.logger.warning(f"Returning error code {count}.")
         return count
 
+    def log_exclusion_cache_info(self):
+        """Logs the statistics of the caches of exclusion decisions of the sub-checkers in verbose mode"""
+        for checker in self.checkers.values():
+            checker.log_exclusion_cache_info()
+
+    def apply_limits(self, config):
+        """Replaces the limits of all classifications by the ones of the given configuration, e.g. of a limit profile
+
+        Classifications that are not in the configuration get a minimum and maximum of 0.
+
+        Args:
+            config (dict): Configuration with the limits per classification and optionally ``group_by``
+
+        Raises:
+            WarningsConfigError: Unrecognized classification
+        """
+        self.group_limits = {}
+        limits = {}
+        for classification, checker_config in config.items():
+            if classification in NON_LIMIT_KEYS:
+                continue
+            if classification == "group_by":
+                self.set_group_limits(checker_config)
+                continue
+            classification_key = classification.lower().replace("_", " ")
+            if classification_key not in self.checkers:
+                raise WarningsConfigError(f"Unrecognized classification {classification!r}")
+            limits[classification_key] = checker_config
+        for classification_key, checker in self.checkers.items():
+            checker.apply_limits(limits.get(classification_key, {"min": 0, "max": 0}))
+
+    def save_limits(self):
+        return super().save_limits(), {key: checker.save_limits() for key, checker in self.checkers.items()}
+
+    def restore_limits(self, limits):
+        limits, limits_per_classification = limits
+        super().restore_limits(limits)
+        for classification_key, checker_limits in limits_per_classification.items():
+            self.checkers[classification_key].restore_limits(checker_limits)
+
     def check(self, content):
         """
         Function for counting the number of warnings, but adopted for Coverity
         output
 
+        A defect is counted once its last event has been seen, or at the end of the input.
+
         Args:
             content (str): The content to parse
         """
-        matches = re.finditer(self.pattern, content)
+        log_line = self._log_line_counter(content) if self.jsonl_writer else None
+        matches = self.find_matches(content)
         for match in matches:
-            if (classification := match.group("classification").lower()) in self.checkers:
-                checker = self.checkers[classification]
-                checker.cq_enabled = self.cq_enabled
-                checker.exclude_patterns = self.exclude_patterns
-                checker.cq_description_template = self.cq_description_template
-                checker.cq_default_path = self.cq_default_path
-                checker.check(match)
-            else:
-                self.logger.warning(f"Unrecognized classification {match.group('classification')!r}")
+            self._add_event(int(match.group("cid")), match, log_line(match.start()) if log_line else None)
+
+    def end_of_input(self):
+        """Counts the defects of which the last event has not been seen, e.g. because the output got truncated"""
+        for cid in list(self._pending_defects):
+            self._emit_defect(cid)
+
+    def _add_event(self, cid, match, log_line=None):
+        """Adds an event to its defect, which is passed on to its sub-checker once its last event has been added
+
+        Args:
+            cid (int/str): The identifier of the defect
+            match (re.Match): The regex match of the event, or an object that provides the same groups
+            log_line (int/None): Number of the line in the log where the event starts
+        """
+        if cid in self._emitted_cids:
+            if (finding := self._emitted_findings.get(cid)) is not None:
+                CoverityClassificationChecker.add_other_location(finding, *CoverityDefect.location(match))
+            return
+        if (defect := self._pending_defects.get(cid)) is None:
+            classification = match.group("classification")
+            checker = self._dispatch.get(classification) or self.checkers.get(classification.lower())
+            if checker is None:
+                self.logger.warning(f"Unrecognized classification {classification!r}")
+                return
+            defect = self._pending_defects[cid] = CoverityDefect(checker)
+        defect.add_event(match, log_line)
+        if match.group("curr") == match.group("max"):
+            self._emit_defect(cid)
+
+    def _emit_defect(self, cid):
+        """Passes the last seen event of a defect, with the locations of its other events, to its sub-checker
+
+        The CID is remembered, so that later events of the same defect, e.g. in another input or an event that comes
+        after the last one, are not counted again. Their locations are added to the Code Quality finding of the defect.
+
+        Args:
+            cid (int/str): The identifier of a pending defect
+        """
+        defect = self._pending_defects.pop(cid)
+        checker = defect.checker
+        count = checker.count
+        finding_count = len(checker.cq_findings)
+        checker.check(defect.event, defect.log_line, defect.other_locations)
+        self._emitted_cids.add(cid)
+        if len(checker.cq_findings) > finding_count:
+            self._emitted_findings[cid] = checker.cq_findings[-1]
+        if self.group_by and checker.count > count:
+            self._count_group(defect.event)
 
     def parse_config(self, config):
         """Process configuration
@@ -159,7 +736,15 @@ class CoverityChecker(RegexChecker):
         if value := config.pop("cq_default_path", None):
             self.cq_default_path = value
         if value := config.pop("exclude", None):
+            pattern_count = len(self.exclude_patterns)
             self.add_patterns(value, self.exclude_patterns)
+            for checker in self.checkers.values():
+                checker.exclude_patterns.extend(self.exclude_patterns[pattern_count:])
+        root = config.pop("exclude_fields_root", None)
+        if value := config.pop("exclude_fields", None):
+            self.add_field_exclusions(value, root)
+        if value := config.pop("group_by", None):
+            self.set_group_limits(value)
         for classification, checker_config in config.items():
             classification_key = classification.lower().replace("_", " ")
             if classification_key in self.checkers:
@@ -168,6 +753,47 @@ class CoverityChecker(RegexChecker):
                 self.logger.warning(f"Unrecognized classification {classification!r}")
 
 
+class CoverityDefect:
+    """Events of a Coverity defect of which the last event has not been seen yet
+
+    Only the group values of the last event are kept, together with the distinct locations of all events.
+    """
+    __slots__ = ("checker", "event", "log_line", "locations")
+
+    def __init__(self, checker):
+        """Constructor
+
+        Args:
+            checker (CoverityClassificationChecker): The sub-checker of the classification of the defect
+        """
+        self.checker = checker
+        self.event = None
+        self.log_line = None
+        self.locations = {}  # path and line number of each event, in order of appearance
+
+    @staticmethod
+    def location(match):
+        """Returns the path and line number of an event"""
+        return match.group("path").strip(), match.group("line")
+
+    def add_event(self, match, log_line=None):
+        """Adds an event; the last event that is added is the one to report
+
+        Args:
+            match (re.Match): The regex match of the event, or an object that provides the same groups
+            log_line (int/None): Number of the line in the log where the match starts
+        """
+        self.event = CachedMatch(match) if isinstance(match, re.Match) else match
+        self.log_line = log_line
+        self.locations[self.location(match)] = None
+
+    @property
+    def other_locations(self):
+        """List[tuple]: Path and line number of the events, other than the one to report, in order of appearance"""
+        location = self.location(self.event)
+        return [other_location for other_location in self.locations if other_location != location]
+
+
 class CoverityClassificationChecker(WarningsChecker):
     name = "coverity_sub"
     logging_fmt = "{checker.name_repr}: {checker.classification:<14} | {message}"
@@ -197,11 +823,12 @@ class CoverityClassificationChecker(WarningsChecker):
     def cq_description_template(self, template_obj):
         self._cq_description_template = template_obj
 
-    def add_code_quality_finding(self, match):
+    def add_code_quality_finding(self, match, other_locations=()):
         """Add code quality finding
 
         Args:
             match (re.Match): The regex match
+            other_locations (list[tuple]): Path and line number of the other events of the defect
         """
         groups = {name: result for name, result in match.groupdict().items() if result}
         try:
@@ -220,23 +847,57 @@ class CoverityClassificationChecker(WarningsChecker):
         if column := groups.get("column", 1):
             finding.column = column
 
-        self.cq_findings.append(finding.to_dict())
+        finding_dict = finding.to_dict()
+        for path, line in other_locations:
+            self.add_other_location(finding_dict, path, line)
+        self.cq_findings.append(finding_dict)
 
-    def check(self, content):
+    @staticmethod
+    def add_other_location(finding, path, line):
+        """Adds the location of another event of the defect to a Code Quality finding
+
+        Args:
+            finding (dict): The Code Quality finding of the defect
+            path (str): Path to the file of the event
+            line (str/None): Line number of the event
+        """
+        location = {"path": Finding.relative_path(path), "lines": {"begin": int(line or 1)}}
+        own_location = finding["location"]
+        own_line = own_location["positions"]["begin"]["line"]
+        if (location["path"], location["lines"]["begin"]) == (own_location["path"], own_line):
+            return
+        if location not in (other_locations := finding.setdefault("other_locations", [])):
+            other_locations.append(location)
+
+    @property
+    def sub_checker_name(self):
+        """str: The Coverity classification"""
+        return self.classification
+
+    def check(self, content, log_line=None, other_locations=()):
         """
         Function for counting the number of warnings, but adopted for Coverity output.
-        Multiple warnings for the same CID are counted as one.
+        The parent checker passes one event per CID, so that multiple events of the same CID are counted as one.
 
         Args:
             content (re.Match): The regex match
+            log_line (int/None): Number of the line in the log where the match starts, for the JSON Lines output
+            other_locations (list[tuple]): Path and line number of the other events of the defect
         """
         match_string = content.group(0).strip()
-        if not self._is_excluded(match_string) and (content.group("curr") == content.group("max")):
+        if self.field_exclusions and self._is_field_excluded(
+                match_string, lambda field: content.group(field) if field in content.re.groupindex else None):
+            return
+        if not self._is_excluded(match_string):
             self.count += 1
             self.logger.info(match_string)
             self.logger.debug(match_string)
             if self.cq_enabled:
-                self.add_code_quality_finding(content)
+                self.add_code_quality_finding(content, other_locations)
+            if self.jsonl_writer:
+                self.write_jsonl_record(f"CID {content.group('cid')}: {content.group('checker')}",
+                                        path=content.group("path"), line=content.group("line"),
+                                        severity=self.SEVERITY_MAP[self.classification], log_line=log_line)
 
 
 class DoxyChecker(RegexChecker):
@@ -247,16 +908,56 @@ class DoxyChecker(RegexChecker):
 class SphinxChecker(RegexChecker):
     name = "sphinx"
     pattern = sphinx_pattern
-    sphinx_deprecation_regex = r"(?m)^(?:(.+?:(?:\d+|None)?):?\s*)?(DEBUG|INFO|WARNING|ERROR|SEVERE|(?:\w+Sphinx\d+Warning)):\s*(.+)$"
+    regex = SPHINX_WARNING_REGEX
+    sphinx_deprecation_regex = r"(?m)^(?:((?P<path1>.+?):(?P<line1>\d+|None)?):?\s*)?(?P<severity1>DEBUG|INFO|WARNING|ERROR|SEVERE|(?:\w+Sphinx\d+Warning)):\s*(?P<description1>.+)$"
     sphinx_deprecation_regex_in_match = "RemovedInSphinx\\d+Warning"
 
+    def set_min_severity(self, severity):
+        """Configures the lowest severity of the warnings to count; warnings with a lower severity are ignored
+
+        The lower severities are removed from the pattern, so that they don't even match.
+
+        Args:
+            severity (str): The minimum severity, e.g. ``"warning"``
+
+        Raises:
+            WarningsConfigError: Unknown severity
+        """
+        super().set_min_severity(severity)
+        self.pattern = re.compile(self._fold_min_severity(self.regex))
+        self._severity_filter_level = 0  # the pattern no longer matches the lower severities
+
+    def _fold_min_severity(self, regex):
+        """Removes the severities below the minimum severity from the alternation of severities in the regex
+
+        Args:
+            regex (str): The regex with all severities
+
+        Returns:
+            str: The regex that only matches the severities that are counted
+        """
+        for severity in ("DEBUG", "INFO", "WARNING", "ERROR", "SEVERE"):
+            if self.SEVERITY_LEVELS[severity.lower()] < self.min_severity_level:
+                regex = regex.replace(f"{severity}|", "", 1)
+        return regex
+
     def include_sphinx_deprecation(self):
         """
         Adds the pattern for sphinx_deprecation_regex to the list patterns to include and alters the main pattern
         """
-        self.pattern = re.compile(self.sphinx_deprecation_regex)
+        self.regex = self.sphinx_deprecation_regex
+        self.pattern = re.compile(self._fold_min_severity(self.regex))
         self.add_patterns([self.sphinx_deprecation_regex_in_match], self.include_patterns)
 
+    def add_code_quality_finding(self, match):
+        """Add code quality finding, except for a deprecation warning, as its path is part of Sphinx or an extension
+
+        Args:
+            match (re.Match): The regex match
+        """
+        if not re.fullmatch(self.sphinx_deprecation_regex_in_match, self.field_value(match, "severity") or ""):
+            super().add_code_quality_finding(match)
+
 
 class XMLRunnerChecker(RegexChecker):
     name = "xmlrunner"
@@ -0,0 +1,136 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Detection of user-supplied regexes that are prone to catastrophic backtracking
+
+The shape of a regex is inspected with the parser of the ``re`` module. That parser is not a public API, so the
+inspection is skipped when it is not available or cannot parse the regex.
+"""
+
+import time
+
+try:
+    from re import _parser as sre_parse  # Python >= 3.11
+except ImportError:
+    try:
+        import sre_parse
+    except ImportError:
+        sre_parse = None
+
+PROBE_CHARACTERS = ("a", "0", " ", "a ", "/", "\t", "a:")
+PROBE_LENGTHS = range(4, 25)  # one character longer per step, so that the last search overshoots the budget little
+PROBE_BUDGET = 0.05  # seconds allowed for a single search of a probe string
+PROBE_TOTAL_BUDGET = 1.0  # seconds after which no more probe strings are searched for a regex
+
+_REPEATS = {sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT} if sre_parse is not None else set()
+
+
+def _subpatterns(op, av):
+    """Yields the nested subpatterns of a parsed regex item"""
+    if op in _REPEATS:
+        yield av[2]
+    elif op == sre_parse.SUBPATTERN:
+        yield av[-1]
+    elif op == sre_parse.BRANCH:
+        yield from av[1]
+    elif op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+        yield av[1]
+    elif op == sre_parse.GROUPREF_EXISTS:
+        yield from (item for item in av[1:] if item is not None)
+
+
+def _has_unbounded_repeat(subpattern):
+    """Returns True when the parsed subpattern contains a quantifier without upper limit"""
+    for op, av in subpattern:
+        if op in _REPEATS and av[1] == sre_parse.MAXREPEAT:
+            return True
+        if any(_has_unbounded_repeat(item) for item in _subpatterns(op, av)):
+            return True
+    return False
+
+
+def _has_nested_quantifier(subpattern):
+    """Returns True when an unbounded quantifier applies to a subpattern that has an unbounded quantifier itself"""
+    for op, av in subpattern:
+        if op in _REPEATS and av[1] == sre_parse.MAXREPEAT and _has_unbounded_repeat(av[2]):
+            return True
+        if any(_has_nested_quantifier(item) for item in _subpatterns(op, av)):
+            return True
+    return False
+
+
+def _literal_prefix(subpattern):
+    """Returns the literal text that every match of the parsed subpattern starts with"""
+    prefix = ""
+    for op, av in subpattern:
+        if op == sre_parse.LITERAL:
+            prefix += chr(av)
+        elif op == sre_parse.SUBPATTERN:
+            prefix += _literal_prefix(av[-1])
+            break
+        elif op != sre_parse.AT:
+            break
+    return prefix
+
+
+def find_backtracking_shape(pattern):
+    """Looks for known shapes of catastrophic backtracking in a compiled regex
+
+    Args:
+        pattern (re.Pattern): The compiled regex
+
+    Returns:
+        str/None: Description of the risky shape, None if no such shape was found
+    """
+    if (parsed := _parse(pattern)) is not None and _has_nested_quantifier(parsed):
+        return "an unbounded quantifier on a group that contains an unbounded quantifier"
+    return None
+
+
+def _parse(pattern):
+    """Returns the parsed subpattern of a compiled regex, or None if the parser of the ``re`` module is not usable"""
+    if sre_parse is None:
+        return None
+    try:
+        return sre_parse.parse(pattern.pattern, pattern.flags)
+    except Exception:  # the private API may change between Python versions
+        return None
+
+
+def probe_backtracking(pattern):
+    """Searches adversarial strings of increasing length with the regex and measures the time it takes
+
+    Each probe string repeats a character after the literal prefix of the regex and ends with a character that is
+    unlikely to match, so that a regex with catastrophic backtracking tries an exponential amount of paths. The probe
+    string grows by one character at a time and probing stops at the first search that exceeds ``PROBE_BUDGET``. That
+    search is repeated before the regex is considered too slow, so that a single delay of e.g. a loaded machine does
+    not reject it. Probing stops as well once the searches took ``PROBE_TOTAL_BUDGET`` in total.
+
+    Args:
+        pattern (re.Pattern): The compiled regex
+
+    Returns:
+        tuple(int, float)/None: The length of the probe string and the time in seconds the search took when it
+            exceeded ``PROBE_BUDGET``, None otherwise
+    """
+    parsed = _parse(pattern)
+    prefix = _literal_prefix(parsed) if parsed is not None else ""
+    total = 0.0
+    for character in PROBE_CHARACTERS:
+        for length in PROBE_LENGTHS:
+            probe = prefix + character * length + "\x00"
+            elapsed = _time_search(pattern, probe)
+            total += elapsed
+            if elapsed > PROBE_BUDGET:
+                elapsed = min(elapsed, _time_search(pattern, probe))
+                if elapsed > PROBE_BUDGET:
+                    return len(probe), elapsed
+            if total > PROBE_TOTAL_BUDGET:
+                return None
+    return None
+
+
+def _time_search(pattern, string):
+    """Returns the time in seconds it takes to search a string with a compiled regex"""
+    start = time.perf_counter()
+    pattern.search(string)
+    return time.perf_counter() - start
@@ -1,23 +1,31 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import sys
-
-from junitparser import Error, Failure
+from io import BytesIO
+from xml.etree import ElementTree
+from xml.parsers import expat
 
 from .exceptions import WarningsConfigError
-from .junit_checker import JUnitChecker
+from .junit_checker import FAILING_RESULTS, CaseResult, CaseResultReader, JUnitChecker
 from .warnings_checker import WarningsChecker
 
+READ_SIZE = 1 << 16  # bytes of an output.xml file to parse at once
+
 
 class RobotChecker(WarningsChecker):
     name = "robot"
     logging_fmt = "{checker.name_repr}: {message}"
+    parse_error = expat.ExpatError
 
     def __init__(self, *logging_args):
         ''' Constructor '''
         super().__init__(*logging_args)
         self.checkers = []
         self.allow_unconfigured = True
+        self.classname_ids = {}  # classname -> ID; shared with the suite checkers
+        self._reader = None  # of the document that is being fed
+        self._reader_failed = False
+        self._suites_of = None
 
     @property
     def minimum(self):
@@ -53,8 +61,12 @@ class RobotChecker(WarningsChecker):
 
     @property
     def ignored_testsuites(self):
-        ignored_testcases = set.intersection(*(c.ignored_testsuites for c in self.checkers))
-        return sorted({t.classname.split(".")[-1] for t in ignored_testcases})
+        """list[str]: Sorted names of the test suites of the classnames that none of the suite checkers matched"""
+        if not self.checkers:
+            return []
+        ignored_ids = set.intersection(*(checker.ignored_testsuites for checker in self.checkers))
+        classnames = {classname_id: classname for classname, classname_id in self.classname_ids.items()}
+        return sorted({classnames[classname_id].split(".")[-1] for classname_id in ignored_ids})
 
     def check(self, content):
         """
@@ -64,8 +76,110 @@ class RobotChecker(WarningsChecker):
         Args:
             content (str): The content to parse
         """
+        self.check_file(BytesIO(content.encode("utf-8")))
+
+    def check_file(self, file):
+        """Function for counting the number of failures per test suite in an open file, which is parsed once
+
+        Each test case is passed to the suites of which the name is a suffix of its classname. The suites handle their
+        test cases one suite after the other, in the configured order. Of a file that is incomplete or not well-formed,
+        the test cases that have been completed are checked.
+
+        Args:
+            file (io.IOBase): The open file to parse; of a file in text mode, the underlying binary file is read
+        """
+        reader, suites_of = self.create_reader()
+        try:
+            reader.read(getattr(file, "buffer", file))
+        except self.parse_error as err:
+            self.logger.error(str(err))
+        self.route_testcases(reader.new_testcases(complete=True), suites_of)
+        self.verify_suite_names()
+
+    def feed(self, chunk):
+        """Function for counting the number of failures per test suite of the test cases that a chunk completes
+
+        The failures are counted and reported while the document is being written, e.g. by a test run that is still
+        in progress. Each call continues where the previous one stopped.
+
+        Args:
+            chunk (bytes/str): The next part of the XML document
+        """
+        if self._reader is None:
+            self._reader, self._suites_of = self.create_reader()
+        if self._reader_failed:
+            return
+        try:
+            testcases = self._reader.feed(chunk)
+        except self.parse_error as err:
+            self._reader_failed = True
+            self.logger.error(str(err))
+            testcases = self._reader.new_testcases(complete=True)
+        self.route_testcases(testcases, self._suites_of)
+
+    def flush(self):
+        """Function for counting the number of failures per test suite of the remainder of the fed document
+
+        Of a document that is incomplete, the test cases that have been completed stay counted. The suite names are
+        verified once the document has ended.
+
+        Raises:
+            SystemExit: No test case of a suite has been found and its name is to be checked
+        """
+        reader, failed = self._reader, self._reader_failed
+        self._reader, self._reader_failed = None, False
+        if reader is None:
+            return
+        if not failed:
+            try:
+                testcases = reader.close()
+            except self.parse_error as err:
+                self.logger.error(str(err))
+                testcases = reader.new_testcases(complete=True)
+            self.route_testcases(testcases, self._suites_of)
+        self.verify_suite_names()
+
+    def create_reader(self):
+        """Creates a reader of the test cases of a document
+
+        Returns:
+            tuple[CaseResultReader, Callable[[str], Iterable[RobotSuiteChecker]]]: The reader, and the function that
+                returns the suite checkers of the classname of a test case
+        """
+        return CaseResultReader(keep_passed=True), SuiteIndex(self.checkers).suites
+
+    def route_testcases(self, testcases, suites_of):
+        """Passes each test case to the suite checkers it belongs to; the suites handle them in the configured order
+
+        The test cases of a file can be routed in several parts, e.g. while the file is being written.
+
+        Args:
+            testcases (list[CaseResult]): The test cases of (a part of) a file
+            suites_of (Callable[[str], Iterable[RobotSuiteChecker]]): Function that returns the suite checkers of a
+                classname
+        """
+        suite_testcases = {checker: [] for checker in self.checkers}
+        classname_ids = {}  # of the classnames in this file
+        for testcase in testcases:
+            if testcase.classname not in classname_ids:
+                classname_ids[testcase.classname] = self.classname_ids.setdefault(testcase.classname,
+                                                                                  len(self.classname_ids))
+            for checker in suites_of(testcase.classname):
+                suite_testcases[checker].append(testcase)
         for checker in self.checkers:
-            checker.check(content)
+            checker.classname_ids = self.classname_ids
+            ignored_ids = {classname_id for classname, classname_id in classname_ids.items()
+                           if checker not in suites_of(classname)}
+            checker.check_testcases(suite_testcases[checker], ignored_ids)
+
+    def verify_suite_names(self):
+        """Exits when no test case has been found of a suite of which the name is to be checked
+
+        Raises:
+            SystemExit: No suite with the name of a suite checker found. Returning error code -1.
+        """
+        for checker in self.checkers:
+            checker.verify_suite_name()
 
     def return_count(self):
         """Getter function for the amount of warnings found
@@ -76,11 +190,16 @@ class RobotChecker(WarningsChecker):
         self.count = 0
         for checker in self.checkers:
             self.count += checker.return_count()
-        if not self.allow_unconfigured and self.ignored_testsuites:
-            raise WarningsConfigError(f"{len(self.ignored_testsuites)} test suites have been ignored due to "
-                                      f"incomplete configuration: {self.ignored_testsuites}")
+        if not self.allow_unconfigured and (ignored_testsuites := self.ignored_testsuites):
+            raise WarningsConfigError(f"{len(ignored_testsuites)} test suites have been ignored due to "
+                                      f"incomplete configuration: {ignored_testsuites}")
         return self.count
 
+    def log_exclusion_cache_info(self):
+        """Logs the statistics of the caches of exclusion decisions of the sub-checkers in verbose mode"""
+        for checker in self.checkers:
+            checker.log_exclusion_cache_info()
+
     def return_check_limits(self):
         """Function for checking whether the warning count is within the configured limits
 
@@ -95,6 +214,34 @@ class RobotChecker(WarningsChecker):
             self.logger.warning(f"Returning error code {count}.")
         return count
 
+    def apply_limits(self, config):
+        """Replaces the limits of all suites by the ones of the given configuration, e.g. of a limit profile
+
+        Suites that are not in the configuration get a minimum and maximum of 0.
+
+        Args:
+            config (dict): Configuration with a list of ``suites``, each with a ``name``, ``min`` and ``max``
+
+        Raises:
+            WarningsConfigError: The configuration contains a suite that has not been configured for the checker
+        """
+        limits = {suite_config["name"]: suite_config for suite_config in config.get("suites", [])}
+        suite_names = [checker.suite_name for checker in self.checkers]
+        for name in limits:
+            if name not in suite_names:
+                raise WarningsConfigError(f"Suite {name!r} has not been configured for the Robot checker")
+        for checker in self.checkers:
+            checker.apply_limits(limits.get(checker.suite_name, {"min": 0, "max": 0}))
+
+    def save_limits(self):
+        return super().save_limits(), [checker.save_limits() for checker in self.checkers]
+
+    def restore_limits(self, limits):
+        limits, limits_per_suite = limits
+        super().restore_limits(limits)
+        for checker, checker_limits in zip(self.checkers, limits_per_suite):
+            checker.restore_limits(checker_limits)
+
     def parse_config(self, config):
         self.allow_unconfigured = config.get("allow_unconfigured", True)
         check_suite_name = config.get("check_suite_names", True)
@@ -104,6 +251,43 @@ class RobotChecker(WarningsChecker):
             self.checkers.append(checker)
 
 
+class SuiteIndex:
+    """Index of suite checkers by reversed suite name, to find the suites of which a classname ends with the name"""
+
+    def __init__(self, checkers):
+        """Constructor
+
+        Args:
+            checkers (list[RobotSuiteChecker]): The suite checkers to index
+        """
+        self._tree = {}  # nested dicts per character of the reversed suite names; key None holds the checkers
+        for checker in checkers:
+            node = self._tree
+            for char in reversed(checker.suite_name):
+                node = node.setdefault(char, {})
+            node.setdefault(None, []).append(checker)
+        self._suites = {}
+
+    def suites(self, classname):
+        """Returns the suite checkers of which the suite name is a suffix of the given classname
+
+        Args:
+            classname (str): The classname of a test case
+
+        Returns:
+            tuple[RobotSuiteChecker]: The matching suite checkers
+        """
+        if (suites := self._suites.get(classname)) is None:
+            node = self._tree
+            suites = list(node.get(None, ()))
+            for char in reversed(classname):
+                if (node := node.get(char)) is None:
+                    break
+                suites.extend(node.get(None, ()))
+            suites = self._suites[classname] = tuple(suites)
+        return suites
+
+
 class RobotSuiteChecker(JUnitChecker):
     name = "robot_sub"
     logging_fmt = "{checker.name_repr}: {checker.suite_name_repr:<20} {message}"
@@ -119,7 +303,18 @@ class RobotSuiteChecker(JUnitChecker):
         self.suite_name = suite_name
         self.check_suite_name = check_suite_name
         self.is_valid_suite_name = False
-        self.ignored_testsuites = set()
+        self.ignored_testsuites = set()  # IDs of the classnames of the test cases that do not belong to the suite
+        self.classname_ids = {}  # classname -> ID; replaced by the one of the parent checker
+
+    @property
+    def sub_checker_name(self):
+        """str: The name of the test suite"""
+        return self.suite_name
+
+    @property
+    def keep_passed(self):
+        """bool: True, as the test cases that do not belong to the suite are tracked"""
+        return True
 
     @property
     def suite_name_repr(self):
@@ -133,7 +328,7 @@ class RobotSuiteChecker(JUnitChecker):
         failure/error message.
 
         Args:
-            testcase (junitparser.TestCase): Test case element to check for failure or error
+            testcase (CaseResult): Result of the test case to check for failure or error
 
         Returns:
             int: 1 if a failure/error is to be subtracted from the final count, 0 otherwise
@@ -141,8 +336,8 @@ class RobotSuiteChecker(JUnitChecker):
         if testcase.classname.endswith(self.suite_name):
             self.is_valid_suite_name = True
             return super()._check_testcase(testcase)
-        self.ignored_testsuites.add(testcase)
-        return int(isinstance(testcase.result, (Failure, Error)))
+        self.ignored_testsuites.add(self.classname_ids.setdefault(testcase.classname, len(self.classname_ids)))
+        return int(testcase.result in FAILING_RESULTS)
 
     def check(self, content):
         """Function for counting the number of JUnit failures in a specific text
@@ -156,6 +351,182 @@ class RobotSuiteChecker(JUnitChecker):
             SystemExit: No suite with name ``self.suite_name`` found. Returning error code -1.
         """
         super().check(content)
+        self.verify_suite_name()
+
+    def check_testcases(self, testcases, ignored_ids):
+        """Function for counting the number of failures of test cases that have been matched to the suite already
+
+        Args:
+            testcases (list[CaseResult]): The test cases of which the classname ends with the suite name
+            ignored_ids (set[int]): IDs of the classnames of the other test cases, see ``classname_ids``
+        """
+        amount_to_exclude = 0
+        for testcase in testcases:
+            self.is_valid_suite_name = True
+            amount_to_exclude += super()._check_testcase(testcase)
+        self.count += sum(testcase.result in FAILING_RESULTS for testcase in testcases) - amount_to_exclude
+        self.ignored_testsuites.update(ignored_ids)
+
+    def verify_suite_name(self):
+        """Exits when no test case of the suite has been found, if the suite name is to be checked
+
+        Raises:
+            SystemExit: No suite with name ``self.suite_name`` found. Returning error code -1.
+        """
         if not self.is_valid_suite_name and self.check_suite_name:
             self.logger.error(f"No suite with name {self.suite_name!r} found. Returning error code -1.")
             sys.exit(-1)
+
+
+class OutputReader:
+    """Reads the results of the tests of a native output.xml of Robot Framework, see ``RobotOutputChecker``
+
+    Each element is discarded as soon as it closes, so that the memory use does not grow with the size of keywords and
+    their messages. The full names of the suites are the classnames of the results.
+    """
+    STATUS_RESULTS = {"FAIL": "failure", "SKIP": "skipped", "NOT RUN": "skipped"}
+
+    def __init__(self, checkers):
+        """Constructor
+
+        Args:
+            checkers (list[RobotSuiteChecker]): The suite checkers to find the test cases of
+        """
+        self.suite_names = {}
+        for checker in checkers:
+            self.suite_names.setdefault(checker.suite_name, []).append(checker)
+        self.suite_checkers = {}  # full suite name -> suite checkers it belongs to
+        self._testcases = []  # not returned by ``new_testcases`` yet
+        self._suites = []  # full names of the open suites
+        self._path = []  # open elements
+        self._parser = ElementTree.XMLPullParser(events=("start", "end"))
+
+    def suites(self, classname):
+        """Returns the suite checkers of the tests of a suite
+
+        Args:
+            classname (str): The full name of the suite
+
+        Returns:
+            Iterable[RobotSuiteChecker]: The suite checkers of which the configured name is the full name of the suite
+            or of one of its parents, or a suffix of it after a dot
+        """
+        return self.suite_checkers.get(classname, ())
+
+    def read(self, source):
+        """Reads a complete document
+
+        Args:
+            source (io.BufferedIOBase): The open XML file in binary mode
+
+        Returns:
+            list[CaseResult]: The results of the tests, in document order
+
+        Raises:
+            xml.etree.ElementTree.ParseError: The content is not well-formed XML
+        """
+        while chunk := source.read(READ_SIZE):
+            self._parser.feed(chunk)
+            self._read_events()
+        self._parser.close()
+        self._read_events()
+        return self._testcases
+
+    def feed(self, data):
+        """Reads the next part of a document, which does not need to end at the boundary of an element
+
+        Args:
+            data (bytes/str): The next part of the XML document
+
+        Returns:
+            list[CaseResult]: The results of the tests that have been completed since the previous call
+
+        Raises:
+            xml.etree.ElementTree.ParseError: The content is not well-formed XML
+        """
+        self._parser.feed(data)
+        self._read_events()
+        return self.new_testcases()
+
+    def close(self):
+        """Ends the document that has been fed
+
+        Returns:
+            list[CaseResult]: The results of the tests that have not been returned by ``feed`` yet
+
+        Raises:
+            xml.etree.ElementTree.ParseError: The document is incomplete or not well-formed
+        """
+        self._parser.close()
+        self._read_events()
+        return self.new_testcases()
+
+    def new_testcases(self, complete=False):
+        """Returns the results of the tests that have been completed and that have not been returned yet
+
+        Args:
+            complete (bool): Unused; each test is final as soon as it closes
+
+        Returns:
+            list[CaseResult]: The results of the tests, in document order
+        """
+        testcases, self._testcases = self._testcases, []
+        return testcases
+
+    def _read_events(self):
+        path = self._path
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                if elem.tag == "suite" and path and path[-1].tag in ("robot", "suite"):
+                    self._start_suite(elem.get("name"))
+                path.append(elem)
+                continue
+            path.pop()
+            if elem.tag == "suite" and path and path[-1].tag in ("robot", "suite"):
+                self._suites.pop()
+            elif elem.tag == "test" and path and path[-1].tag == "suite":
+                status = elem.find("status")
+                result = self.STATUS_RESULTS.get(status.get("status")) if status is not None else None
+                self._testcases.append(CaseResult(self._suites[-1], elem.get("name"), result,
+                                                  status.text if status is not None else None, None))
+            if path and not (elem.tag == "status" and path[-1].tag == "test"):
+                path[-1].remove(elem)  # its previous siblings have been removed already
+
+    def _start_suite(self, name):
+        suites = self._suites
+        full_name = f"{suites[-1]}.{name}" if suites else name
+        checkers = set(self.suite_checkers.get(suites[-1], ())) if suites else set()
+        parts = full_name.split(".")
+        checkers.update(checker for index in range(len(parts) + 1)
+                        for checker in self.suite_names.get(".".join(parts[index:]), ()))
+        self.suite_checkers[full_name] = checkers
+        suites.append(full_name)
+
+
+class RobotOutputChecker(RobotChecker):
+    """Checker for the native output.xml of Robot Framework, with the same configuration as the Robot checker
+
+    The test cases of a configured suite are the ones in the suites of which the full name, e.g.
+    ``Top Suite.Suite One``, equals the configured name or ends with it after a dot. The file is parsed while it is
+    read, see ``OutputReader``.
+    """
+    name = "robot_output"
+    parse_error = ElementTree.ParseError
+
+    @property
+    def name_repr(self):
+        return "Robot"
+
+    @property
+    def sub_logger_name(self):
+        return RobotSuiteChecker.name
+
+    def create_reader(self):
+        """Creates a reader of the tests of an output.xml document
+
+        Returns:
+            tuple[OutputReader, Callable[[str], Iterable[RobotSuiteChecker]]]: The reader, and the function that
+                returns the suite checkers of the full name of a suite
+        """
+        reader = OutputReader(self.checkers)
+        return reader, reader.suites
@@ -9,20 +9,41 @@ import logging
 import os
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from importlib.metadata import distribution
 from pathlib import Path
 
-from ruamel.yaml import YAML
+from ruamel.yaml import YAML, YAMLError
 
+from .code_quality import Finding
+from .coverity_json_checker import CoverityJsonChecker
 from .exceptions import WarningsConfigError
-from .junit_checker import JUnitChecker
+from .junit_checker import JUnitChecker, read_file_testcases
+from .output_writer import close_output, flush_output
 from .polyspace_checker import PolyspaceChecker
-from .regex_checker import CoverityChecker, DoxyChecker, SphinxChecker, XMLRunnerChecker
-from .robot_checker import RobotChecker
+from .regex_checker import (CoverityChecker, CustomRegexChecker, DoxyChecker, RegexChecker, SphinxChecker,
+                            XMLRunnerChecker)
+from .robot_checker import RobotChecker, RobotOutputChecker
 
 __version__ = distribution("mlx.warnings").version
 
 LOGGER = logging.getLogger(__name__)
+CHUNK_SIZE = 1 << 20
+
+
+def load_file(path):
+    """Loads a JSON or YAML file, e.g. a configuration file or a manifest
+
+    Args:
+        path (Path): Path to the file; a suffix that starts with ``.y`` means YAML, JSON otherwise
+
+    Returns:
+        dict: Content of the file
+    """
+    with open(path, encoding="utf-8") as open_file:
+        if path.suffix.lower().startswith(".y"):
+            return YAML().load(open_file)
+        return json.load(open_file)
 
 
 class WarningsPlugin:
@@ -37,11 +58,12 @@ class WarningsPlugin:
         self.activated_checkers = {}
         self.cq_enabled = cq_enabled
         self.public_checkers = (SphinxChecker, DoxyChecker, JUnitChecker, XMLRunnerChecker, CoverityChecker,
-                                RobotChecker, PolyspaceChecker)
+                                RobotChecker, PolyspaceChecker, CoverityJsonChecker, RobotOutputChecker)
         self._minimum = 0
         self._maximum = 0
         self.count = 0
         self.printout = False
+        self.profiles = {}
 
     def activate_checker(self, checker_type, *logging_args):
         """
@@ -55,7 +77,7 @@ class WarningsPlugin:
         """
         checker = checker_type(*logging_args)
         checker.cq_enabled = self.cq_enabled and checker.name in ("doxygen", "sphinx", "xmlrunner", "polyspace",
-                                                                  "coverity")
+                                                                  "coverity", "coverity_json")
         self.activated_checkers[checker.name] = checker
         return checker
 
@@ -76,6 +98,26 @@ class WarningsPlugin:
         else:
             LOGGER.error(f"Checker {name} does not exist")
 
+    def activate_custom_checker(self, name, *logging_args):
+        """
+        Activates a checker with a user-defined regex
+
+        Args:
+            name (str): name of the custom checker
+
+        Returns:
+            CustomRegexChecker: activated checker object
+
+        Raises:
+            WarningsConfigError: The name is already in use by another checker
+        """
+        if name in self.activated_checkers or any(name == checker_type.name for checker_type in self.public_checkers):
+            raise WarningsConfigError(f"Custom checker name {name!r} is already in use by another checker")
+        checker = CustomRegexChecker(name, *logging_args)
+        checker.cq_enabled = self.cq_enabled
+        self.activated_checkers[name] = checker
+        return checker
+
     def get_checker(self, name):
         """Get checker by name
 
@@ -113,15 +155,81 @@ class WarningsPlugin:
         """
         if not self.activated_checkers:
             LOGGER.error("No checkers activated. Please use activate_checker function")
-        elif "polyspace" in self.activated_checkers:
-            if len(self.activated_checkers) > 1:
-                raise WarningsConfigError("Polyspace checker cannot be combined with other warnings checkers")
+            return
+        self.set_source(getattr(file, "name", None))
+        for name in ("polyspace", "coverity_json"):
+            if name in self.activated_checkers and len(self.activated_checkers) > 1:
+                raise WarningsConfigError(f"{self.activated_checkers[name].name_repr} checker cannot be combined with "
+                                          f"other warnings checkers")
+        if "polyspace" in self.activated_checkers:
             self.activated_checkers["polyspace"].check(file)
+        elif "coverity_json" in self.activated_checkers:
+            self.check_stream(file)
+        elif len(self.activated_checkers) == 1:
+            next(iter(self.activated_checkers.values())).check_file(file)
         else:
             content = file.read()
             for checker in self.activated_checkers.values():
                 checker.check(content)
 
+    def check_junit_files(self, paths, jobs):
+        """
+        Count the number of JUnit failures in many files, which are parsed by a pool of worker processes
+
+        The workers send back the compact results of the failed test cases. These are checked in the order of the
+        files, so that the exclusions and the verbose output are the same as when the files are checked one by one.
+        Of a file that is incomplete or not well-formed, the test cases that have been completed are counted.
+
+        Args:
+            paths (list[str]): The paths to the JUnit XML files
+            jobs (int): The number of worker processes
+        """
+        checker = self.activated_checkers["junit"]
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            chunksize = max(1, len(paths) // (jobs * 4))
+            for path, (testcases, error) in zip(paths, executor.map(read_file_testcases, paths, chunksize=chunksize)):
+                self.set_source(path)
+                checker.check_testcase_results(testcases)
+                if error:
+                    checker.logger.error(error)
+
+    def check_stream(self, stream, chunk_size=CHUNK_SIZE):
+        """
+        Count the number of warnings in a stream that is read in chunks, e.g. stdin
+
+        Args:
+            stream (io.TextIOBase): The open stream to parse
+            chunk_size (int): The maximum number of characters to read at once
+        """
+        if not self.activated_checkers:
+            LOGGER.error("No checkers activated. Please use activate_checker function")
+            return
+        if "polyspace" in self.activated_checkers:
+            raise WarningsConfigError("Polyspace checker cannot be used with a stream as input")
+        self.set_source(getattr(stream, "name", None))
+        while chunk := stream.read(chunk_size):
+            for checker in self.activated_checkers.values():
+                checker.feed(chunk)
+        for checker in self.activated_checkers.values():
+            checker.flush()
+
+    def end_of_input(self):
+        """Lets the activated checkers count the warnings that they held back until all input has been checked, e.g.
+        Coverity defects of which the last event is missing
+        """
+        for checker in self.activated_checkers.values():
+            checker.end_of_input()
+
+    def set_source(self, source):
+        """Sets the name of the log that is checked next, for the records of the JSON Lines output
+
+        Args:
+            source (str/None): Name of the log, e.g. the path to the file
+        """
+        for checker in self.activated_checkers.values():
+            if checker.jsonl_writer is not None:
+                checker.jsonl_writer.source = source
+
     def configure_maximum(self, maximum):
         """Configure the maximum amount of warnings for each activated checker
 
@@ -145,7 +253,8 @@ class WarningsPlugin:
 
         If the name parameter is set, this function will return the amount of
         warnings found by that checker. If not, the function will return the sum
-        of the warnings found by all registered checkers.
+        of the warnings found by all registered checkers. The output files are flushed, so that they contain the
+        warnings that have been found so far.
 
         Args:
             name (WarningsChecker): The checker for which to return the amount of warnings (if set)
@@ -153,6 +262,7 @@ class WarningsPlugin:
         Returns:
             int: Amount of found warnings
         """
+        flush_output()
         self.count = 0
         if name is None:
             for checker in self.activated_checkers.values():
@@ -185,6 +295,76 @@ class WarningsPlugin:
 
         return 0
 
+    def return_profile_check_limits(self, profile):
+        """Function for determining the return value of the script for the limits of a profile
+
+        The limits of the profile replace the ones of the checkers that it contains while these checkers are checked.
+        All of them are checked, so that each one reports its limits, and their own limits are restored afterwards.
+
+        Args:
+            profile (str): Name of the limit profile
+
+        Return:
+            int: 0 if the amount of warnings is within the limits of the profile, the count of warnings otherwise
+                (or 1 in case of a count of 0 warnings)
+
+        Raises:
+            WarningsConfigError: Unknown profile, or the profile contains a checker that is not activated
+        """
+        if profile not in self.profiles:
+            raise WarningsConfigError(f"Unknown profile {profile!r}; expected one of {list(self.profiles)}")
+        for name in self.profiles[profile]:
+            if name not in self.activated_checkers:
+                raise WarningsConfigError(f"Profile {profile!r} contains limits for checker {name!r}, which is not "
+                                          "enabled")
+        saved_limits = {name: self.activated_checkers[name].save_limits() for name in self.profiles[profile]}
+        retval = 0
+        try:
+            for name, limits in self.profiles[profile].items():
+                self.activated_checkers[name].apply_limits(limits)
+            for name in self.profiles[profile]:
+                checker_retval = self.activated_checkers[name].return_check_limits()
+                retval = retval or checker_retval
+        finally:
+            for name, limits in saved_limits.items():
+                self.activated_checkers[name].restore_limits(limits)
+        return retval
+
+    def return_check_limits_of_profiles(self, selected_profile=None):
+        """Function for determining the return value of the script for the limits of the checkers and of each profile
+
+        All limits are checked and reported, but only the ones of the selected profile determine the return value.
+
+        Args:
+            selected_profile (str/None): Name of the profile that determines the return value; None to use the limits
+                of the checkers
+
+        Return:
+            int: The return value for the limits of the selected profile, or of the checkers
+        """
+        retval = self.return_check_limits()
+        for profile in self.profiles:
+            LOGGER.warning(f"Limits of profile {profile!r}:")
+            profile_retval = self.return_profile_check_limits(profile)
+            if profile == selected_profile:
+                retval = profile_retval
+        return retval
+
+    def log_exclusion_cache_info(self):
+        """Logs the statistics of the caches of exclusion decisions of all activated checkers in verbose mode"""
+        for checker in self.activated_checkers.values():
+            checker.log_exclusion_cache_info()
+
+    def log_console_summary(self):
+        """Logs, for each activated checker, how many verbose lines the console budget has held back"""
+        for checker in self.activated_checkers.values():
+            checker.log_console_summary()
+
+    def close_logging(self):
+        """Removes the logging handlers of all activated checkers, so that checkers of a next run add their own"""
+        for checker in self.activated_checkers.values():
+            checker.close_logging()
+
     def toggle_printout(self, printout):
         """Toggle printout of all the parsed content
 
@@ -202,11 +382,7 @@ class WarningsPlugin:
             config (dict/Path): Content or path of configuration file
         """
         if isinstance(config, Path):
-            with open(config, encoding="utf-8") as open_file:
-                if config.suffix.lower().startswith(".y"):
-                    config = YAML().load(open_file)
-                else:
-                    config = json.load(open_file)
+            config = load_file(config)
 
         # activate checker
         for checker_type in self.public_checkers:
@@ -220,6 +396,17 @@ class WarningsPlugin:
                 except KeyError as err:
                     raise WarningsConfigError(f"Incomplete config. Missing: {err}") from err
 
+        self.profiles = dict(config.get("profiles", {}))
+
+        for name, checker_config in config.get("custom", {}).items():
+            try:
+                if bool(checker_config["enabled"]):
+                    checker = self.activate_custom_checker(name, *logging_args)
+                    checker.parse_config(checker_config)
+                    LOGGER.info(f"{checker.name_repr}: Config parsing completed")
+            except KeyError as err:
+                raise WarningsConfigError(f"Incomplete config. Missing: {err}") from err
+
     def write_code_quality_report(self, out_file):
         """Generates the Code Quality report artifact as a JSON file that implements a subset of the Code Climate spec
 
@@ -236,13 +423,59 @@ class WarningsPlugin:
             open_file.write(f"{content}\n")
 
 
+def non_negative_int(value):
+    """Converts a command line argument to an integer that is not negative
+
+    Args:
+        value (str): The value of the argument
+
+    Returns:
+        int: The converted value
+
+    Raises:
+        argparse.ArgumentTypeError: The value is not an integer of at least 0
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"expected an integer of at least 0; got {value!r}")
+    return number
+
+
+def positive_int(value):
+    """Converts a command line argument to an integer that is at least 1
+
+    Args:
+        value (str): The value of the argument
+
+    Returns:
+        int: The converted value
+
+    Raises:
+        argparse.ArgumentTypeError: The value is not an integer of at least 1
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected an integer of at least 1; got {value!r}")
+    return number
+
+
 def warnings_wrapper(args):
     parser = argparse.ArgumentParser(prog="mlx-warnings")
     group1 = parser.add_argument_group("Configuration command line options")
     group1.add_argument("--coverity", dest="coverity", action="store_true")
+    group1.add_argument("--coverity-json", dest="coverity_json", action="store_true",
+                        help="Parse the JSON export of Coverity, e.g. of cov-format-errors --json-output-v7")
     group1.add_argument("-d", "--doxygen", dest="doxygen", action="store_true")
     group1.add_argument("-j", "--junit", dest="junit", action="store_true")
     group1.add_argument("-r", "--robot", dest="robot", action="store_true")
+    group1.add_argument("--robot-output", dest="robot_output", action="store_true",
+                        help="Parse the native output.xml of Robot Framework instead of its xUnit file")
     group1.add_argument("-s", "--sphinx", dest="sphinx", action="store_true")
     group1.add_argument("-x", "--xmlrunner", dest="xmlrunner", action="store_true")
     group1.add_argument("--name", default="",
@@ -256,96 +489,139 @@ def warnings_wrapper(args):
     group2 = parser.add_argument_group("Configuration file with options")
     group2.add_argument("--config", dest="configfile", action="store", required=False, type=Path,
                         help="Config file in JSON or YAML format provides toggle of checkers and their limits")
+    group2.add_argument("--profile",
+                        help="Name of the limit profile in the config file that determines the return value")
+    group2.add_argument("--manifest", type=Path,
+                        help="Manifest in JSON or YAML format with jobs to run in one process instead of the "
+                             "logfile arguments: each job has a config, inputs and optionally output files")
     group2.add_argument("--include-sphinx-deprecation", dest="include_sphinx_deprecation", action="store_true",
                         help="Sphinx checker will include warnings matching (RemovedInSphinx\\d+Warning) regex")
     parser.add_argument("-o", "--output", type=Path,
                         help="Output file that contains all counted warnings")
+    parser.add_argument("--output-jsonl", type=Path,
+                        help="Output file in JSON Lines format with a record per counted warning")
     parser.add_argument("-C", "--code-quality",
                         help="Output Code Quality report artifact for GitLab CI")
     parser.add_argument("-v", "--verbose", dest="verbose", action="store_true")
+    parser.add_argument("--console-lines", type=non_negative_int, default=None,
+                        help="Maximum number of verbose lines to print to the console per checker; "
+                             "a summary line reports the amount of lines that got left out")
+    parser.add_argument("--jobs", type=positive_int, default=1,
+                        help="Number of worker processes that parse the logfiles when only the JUnit checker is "
+                             "enabled")
     parser.add_argument("--command", dest="command", action="store_true",
                         help="Treat program arguments as command to execute to obtain data")
     parser.add_argument("--ignore-retval", dest="ignore", action="store_true",
                         help="Ignore return value of the executed command")
     parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
-    parser.add_argument("logfile", nargs="+", help="Logfile (or command) that might contain warnings")
+    parser.add_argument("logfile", nargs="*",
+                        help="Logfile (or command) that might contain warnings; use - to read from stdin")
     parser.add_argument("flags", nargs=argparse.REMAINDER,
                         help="Possible not-used flags from above are considered as command flags")
 
     args = parser.parse_args(args)
-    code_quality_enabled = bool(args.code_quality)
-    if args.output is not None and args.output.exists():
-        os.remove(args.output)
-
-    LOGGER.addHandler(logging.StreamHandler())
-    LOGGER.setLevel(logging.WARNING)
-    if args.verbose:
-        LOGGER.setLevel(logging.INFO)
-
-    logging_args = [args.verbose, args.output]
-    warnings = WarningsPlugin(cq_enabled=code_quality_enabled)
-    # Read config file
-    if args.configfile is not None:
-        checker_flags = args.sphinx or args.doxygen or args.junit or args.coverity or args.xmlrunner or args.robot
-        warning_args = args.maxwarnings or args.minwarnings or args.exact_warnings
-        if checker_flags or warning_args:
-            LOGGER.error("Configfile cannot be provided with other arguments")
-            sys.exit(2)
-        warnings.config_parser(args.configfile, *logging_args)
-    else:
-        if args.sphinx:
-            warnings.activate_checker_name("sphinx", *logging_args)
-        if args.doxygen:
-            warnings.activate_checker_name("doxygen", *logging_args)
-        if args.junit:
-            warnings.activate_checker_name("junit", *logging_args)
-        if args.xmlrunner:
-            warnings.activate_checker_name("xmlrunner", *logging_args)
-        if args.coverity:
-            warnings.activate_checker_name("coverity", *logging_args)
-        if args.robot:
-            robot_checker = warnings.activate_checker_name("robot", *logging_args)
-            if robot_checker is not None:
-                robot_checker.parse_config({
-                    "suites": [{"name": args.name, "min": 0, "max": 0}],
-                    "check_suite_names": True,
-                })
-        if args.exact_warnings:
-            if args.maxwarnings | args.minwarnings:
-                LOGGER.error("expected-warnings cannot be provided with maxwarnings or minwarnings")
+    if args.manifest is None and not args.logfile:
+        parser.error("the following arguments are required: logfile")
+    try:
+        LOGGER.addHandler(logging.StreamHandler())
+        LOGGER.setLevel(logging.WARNING)
+        if args.verbose:
+            LOGGER.setLevel(logging.INFO)
+
+        if args.manifest is not None:
+            if args.configfile is not None or args.logfile or args.command:
+                LOGGER.error("Manifest cannot be provided with a configfile, logfiles or a command")
                 sys.exit(2)
-            warnings.configure_maximum(args.exact_warnings)
-            warnings.configure_minimum(args.exact_warnings)
+            run_options = {"--output": args.output, "--code-quality": args.code_quality,
+                           "--output-jsonl": args.output_jsonl, "--console-lines": args.console_lines,
+                           "--profile": args.profile, "--jobs": args.jobs if args.jobs != 1 else None}
+            if ignored_options := [option for option, value in run_options.items() if value is not None]:
+                LOGGER.error(f"Manifest cannot be provided with {', '.join(ignored_options)}; these are configured "
+                             f"per job in the manifest")
+                sys.exit(2)
+            return warnings_manifest(args.manifest, args.verbose)
+
+        code_quality_enabled = bool(args.code_quality)
+        if args.output is not None and args.output.exists():
+            os.remove(args.output)
+
+        logging_args = [args.verbose, args.output, args.console_lines, args.output_jsonl]
+        warnings = WarningsPlugin(cq_enabled=code_quality_enabled)
+        # Read config file
+        if args.configfile is not None:
+            checker_flags = args.sphinx or args.doxygen or args.junit or args.coverity or args.xmlrunner or args.robot \
+                or args.coverity_json or args.robot_output
+            warning_args = args.maxwarnings or args.minwarnings or args.exact_warnings
+            if checker_flags or warning_args:
+                LOGGER.error("Configfile cannot be provided with other arguments")
+                sys.exit(2)
+            warnings.config_parser(args.configfile, *logging_args)
+        else:
+            if args.sphinx:
+                warnings.activate_checker_name("sphinx", *logging_args)
+            if args.doxygen:
+                warnings.activate_checker_name("doxygen", *logging_args)
+            if args.junit:
+                warnings.activate_checker_name("junit", *logging_args)
+            if args.xmlrunner:
+                warnings.activate_checker_name("xmlrunner", *logging_args)
+            if args.coverity:
+                warnings.activate_checker_name("coverity", *logging_args)
+            if args.coverity_json:
+                warnings.activate_checker_name("coverity_json", *logging_args)
+            for robot_name in ("robot", "robot_output"):
+                if getattr(args, robot_name):
+                    robot_checker = warnings.activate_checker_name(robot_name, *logging_args)
+                    if robot_checker is not None:
+                        robot_checker.parse_config({
+                            "suites": [{"name": args.name, "min": 0, "max": 0}],
+                            "check_suite_names": True,
+                        })
+            if args.exact_warnings:
+                if args.maxwarnings | args.minwarnings:
+                    LOGGER.error("expected-warnings cannot be provided with maxwarnings or minwarnings")
+                    sys.exit(2)
+                warnings.configure_maximum(args.exact_warnings)
+                warnings.configure_minimum(args.exact_warnings)
+            else:
+                warnings.configure_maximum(args.maxwarnings)
+                warnings.configure_minimum(args.minwarnings)
+
+        if args.profile is not None and args.profile not in warnings.profiles:
+            raise WarningsConfigError(f"Unknown profile {args.profile!r}; expected one of {list(warnings.profiles)}")
+
+        if args.include_sphinx_deprecation and "sphinx" in warnings.activated_checkers.keys():
+            warnings.get_checker("sphinx").include_sphinx_deprecation()
+
+        if args.command:
+            if "polyspace" in warnings.activated_checkers:
+                raise WarningsConfigError("Input argument command cannot be combined with Polyspace checker enabled")
+            cmd = args.logfile
+            if args.flags:
+                cmd.extend(args.flags)
+            warnings.toggle_printout(True)
+            retval = warnings_command(warnings, cmd)
+
+            if (not args.ignore) and (retval != 0):
+                return retval
         else:
-            warnings.configure_maximum(args.maxwarnings)
-            warnings.configure_minimum(args.minwarnings)
-
-    if args.include_sphinx_deprecation and "sphinx" in warnings.activated_checkers.keys():
-        warnings.get_checker("sphinx").include_sphinx_deprecation()
-
-    if args.command:
-        if "polyspace" in warnings.activated_checkers:
-            raise WarningsConfigError("Input argument command cannot be combined with Polyspace checker enabled")
-        cmd = args.logfile
-        if args.flags:
-            cmd.extend(args.flags)
-        warnings.toggle_printout(True)
-        retval = warnings_command(warnings, cmd)
-
-        if (not args.ignore) and (retval != 0):
-            return retval
-    else:
-        if args.flags:
-            LOGGER.warning(f"Some keyword arguments have been ignored because they followed positional arguments: "
-                           f"{' '.join(args.flags)!r}")
-        retval = warnings_logfile(warnings, args.logfile)
-        if retval != 0:
-            return retval
-
-    warnings.return_count()
-    if args.code_quality:
-        warnings.write_code_quality_report(args.code_quality)
-    return warnings.return_check_limits()
+            if args.flags:
+                LOGGER.warning(f"Some keyword arguments have been ignored because they followed positional arguments: "
+                               f"{' '.join(args.flags)!r}")
+            retval = warnings_logfile(warnings, args.logfile, args.jobs)
+            if retval != 0:
+                return retval
+
+        warnings.end_of_input()
+        warnings.return_count()
+        warnings.log_console_summary()
+        if args.verbose:
+            warnings.log_exclusion_cache_info()
+        if args.code_quality:
+            warnings.write_code_quality_report(args.code_quality)
+        return warnings.return_check_limits_of_profiles(args.profile)
+    finally:
+        close_output()
 
 
 def warnings_command(warnings, cmd):
@@ -389,12 +665,13 @@ def warnings_command(warnings, cmd):
         raise
 
 
-def warnings_logfile(warnings, log):
+def warnings_logfile(warnings, log, jobs=1):
     """Parse logfile for warnings
 
     Args:
         warnings (WarningsPlugin): Object for warnings where errors should be logged
         log: Logfile for parsing
+        jobs (int): Number of worker processes to parse the logfiles with, if only the JUnit checker is activated
 
     Return:
         0: Log files existed and are parsed successfully
@@ -406,18 +683,127 @@ def warnings_logfile(warnings, log):
     # executing the script on windows (in that case there is no shell expansion of wildcards)
     # so that the script can be used in the exact same way even when moving from one
     # OS to another.
+    in_parallel = jobs > 1 and list(warnings.activated_checkers) == ["junit"]
+    logfiles = []  # to parse in parallel
     for file_wildcard in log:
-        if glob.glob(file_wildcard):
+        if file_wildcard == "-":
+            if logfiles:
+                warnings.check_junit_files(logfiles, jobs)
+                logfiles = []
+            warnings.check_stream(sys.stdin)
+        elif glob.glob(file_wildcard):
+            if in_parallel:
+                logfiles.extend(glob.glob(file_wildcard))
+                continue
             for logfile in glob.glob(file_wildcard):
                 with open(logfile) as file:
                     warnings.check_logfile(file)
         else:
             LOGGER.error(f"FILE: {file_wildcard} does not exist")
             return 1
+    if logfiles:
+        warnings.check_junit_files(logfiles, jobs)
 
     return 0
 
 
+def warnings_manifest(manifest, verbose=False):
+    """Runs the jobs of a manifest in one process
+
+    Each job has a ``config`` file, a list of ``inputs`` (with wildcards) and optionally the paths of an ``output``
+    file, a ``code_quality`` report and a ``status`` file, to which the return value of the job is written, as well
+    as the ``profile`` that determines the return value. An input that more than one job needs is read once and kept
+    in memory until the last of these jobs has run. Their regex checkers share the matches of each pattern, so that
+    such an input is searched once per pattern. A job that fails, e.g. because of an invalid config, gets a return
+    value of 1 and does not stop the jobs that follow.
+
+    Args:
+        manifest (Path): Path to the manifest in JSON or YAML format
+        verbose (bool): Enable/disable verbose logging
+
+    Return:
+        int: 0 if all jobs succeeded, the return value of the first job that failed otherwise
+
+    Raises:
+        WarningsConfigError: Invalid manifest
+    """
+    try:
+        jobs = load_file(manifest)["jobs"]
+        job_inputs = [[logfile for file_wildcard in job["inputs"] for logfile in sorted(glob.glob(file_wildcard))]
+                      for job in jobs]
+    except (KeyError, TypeError) as err:
+        raise WarningsConfigError(f"Invalid manifest {str(manifest)!r}: expected a list of 'jobs', each with a "
+                                  f"'config' and 'inputs'; missing {err}") from None
+    last_job_index = {}
+    shared_inputs = set()  # of more than one job
+    for index, logfiles in enumerate(job_inputs):
+        for logfile in set(logfiles):
+            if logfile in last_job_index:
+                shared_inputs.add(logfile)
+            last_job_index[logfile] = index
+    contents = {}
+    match_caches = {}
+    retval = 0
+    for index, (job, logfiles) in enumerate(zip(jobs, job_inputs)):
+        name = job.get("name", str(index))
+        output = Path(job["output"]) if job.get("output") else None
+        if output is not None and output.exists():
+            os.remove(output)
+        Finding.fingerprints = {}
+        warnings = WarningsPlugin(cq_enabled=bool(job.get("code_quality")))
+        job_retval = 0
+        try:
+            warnings.config_parser(Path(job["config"]), verbose, output)
+            for file_wildcard in job["inputs"]:
+                if not glob.glob(file_wildcard):
+                    LOGGER.error(f"Job {name!r}: FILE: {file_wildcard} does not exist")
+                    job_retval = 1
+                    break
+            else:
+                for logfile in logfiles:
+                    if "polyspace" in warnings.activated_checkers or "coverity_json" in warnings.activated_checkers:
+                        with open(logfile) as file:
+                            warnings.check_logfile(file)
+                        continue
+                    if (content := contents.get(logfile)) is None:
+                        with open(logfile) as file:
+                            content = file.read()
+                    match_cache = None
+                    if logfile in shared_inputs:
+                        contents[logfile] = content
+                        match_cache = match_caches.setdefault(logfile, {})
+                    for checker in warnings.activated_checkers.values():
+                        if isinstance(checker, RegexChecker):
+                            checker.match_cache = match_cache
+                    warnings.set_source(logfile)
+                    warnings.check(content)
+                warnings.end_of_input()
+                warnings.return_count()
+                if job.get("code_quality"):
+                    warnings.write_code_quality_report(job["code_quality"])
+                LOGGER.warning(f"Job {name!r}:")
+                job_retval = warnings.return_check_limits_of_profiles(job.get("profile"))
+        except (WarningsConfigError, OSError, KeyError, ValueError, YAMLError) as err:
+            LOGGER.error(f"Job {name!r}: {err.__class__.__name__}: {err}")
+            job_retval = 1
+        except SystemExit as err:
+            job_retval = err.code if isinstance(err.code, int) and err.code else 1
+        finally:
+            close_output()
+            warnings.close_logging()
+        for logfile in logfiles:
+            if last_job_index[logfile] == index:
+                contents.pop(logfile, None)
+                match_caches.pop(logfile, None)
+        if job.get("status"):
+            Path(job["status"]).parent.mkdir(parents=True, exist_ok=True)
+            with open(job["status"], "w", encoding="utf-8") as open_file:
+                open_file.write(f"{job_retval}\n")
+        if job_retval and not retval:
+            retval = job_retval
+    return retval
+
+
 def main():
     sys.exit(warnings_wrapper(sys.argv[1:]))
 
@@ -4,10 +4,19 @@ import abc
 import logging
 import os
 import re
+from functools import lru_cache
 from math import inf
 from string import Template
 
 from .exceptions import WarningsConfigError
+from .glob_index import GlobIndex, GlobList
+from .output_writer import jsonl_writer, output_handler
+from .regex_guard import find_backtracking_shape, probe_backtracking
+
+EXCLUSION_CACHE_SIZE = 4096
+PATH_FIELDS = ("path", "file")  # fields of which the value is matched with gitignore-style globs
+NON_LIMIT_KEYS = ("enabled", "exclude", "exclude_fields", "exclude_fields_root", "cq_default_path",
+                  "cq_description_template")  # keys of a checker configuration that are ignored by apply_limits
 
 
 def substitute_envvar(checker_config, keys):
@@ -37,11 +46,46 @@ class DebugOnlyFilter(logging.Filter):
         return False
 
 
+class ConsoleBudgetFilter(logging.Filter):
+    """Passes the first INFO records of a logger to the console and counts the ones that are held back"""
+
+    def __init__(self, budget):
+        """Constructor
+
+        Args:
+            budget (int): Maximum number of INFO records to pass
+        """
+        super().__init__()
+        self.budget = budget
+        self.passed = 0
+        self.suppressed = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno != logging.INFO or self.budget is None:
+            return True
+        if self.passed < self.budget:
+            self.passed += 1
+            return True
+        self.suppressed += 1
+        return False
+
+    def release(self):
+        """Lifts the budget so that summary lines get through
+
+        Returns:
+            int: The number of records that have been held back
+        """
+        self.budget = None
+        suppressed = self.suppressed
+        self.suppressed = 0
+        return suppressed
+
+
 class WarningsChecker:
     name = "checker"
     logging_fmt = "{checker.name_repr}: {message}"
 
-    def __init__(self, verbose, output):
+    def __init__(self, verbose, output, console_budget=None, jsonl_output=None):
         """Constructor
 
         The logging is configured. A handler is added only if a parent checker hasn't done this already.
@@ -50,6 +94,8 @@ class WarningsChecker:
         Args:
             verbose (bool): Enable/disable verbose logging
             output (Path/None): The path to the output file
+            console_budget (int/None): Maximum number of verbose lines to print to the console, None for no limit
+            jsonl_output (Path/None): The path to the JSON Lines file with a record per counted warning
         """
         self.count = 0
         self._minimum = 0
@@ -60,7 +106,12 @@ class WarningsChecker:
         self._cq_description_template = Template("$description")
         self.exclude_patterns = []
         self.include_patterns = []
-        self.logging_args = (verbose, output)
+        self.field_exclusions = {}
+        self._chunks = []
+        self._exclusion_decision = lru_cache(maxsize=EXCLUSION_CACHE_SIZE)(self._find_exclusion)
+        self.jsonl_writer = jsonl_writer(jsonl_output) if jsonl_output is not None else None
+        self._log_line_offset = 0
+        self.logging_args = (verbose, output, console_budget, jsonl_output)
 
         self.logger = logging.getLogger(self.name)
         self.logger.setLevel(logging.WARNING)
@@ -77,9 +128,11 @@ class WarningsChecker:
                 handler.setLevel(logging.INFO)
             else:
                 handler.setLevel(logging.WARNING)
+            if console_budget is not None:
+                handler.addFilter(ConsoleBudgetFilter(console_budget))
             self.logger.addHandler(handler)
             if output is not None:
-                handler = logging.FileHandler(output, "a")
+                handler = output_handler(output)
                 handler.setFormatter(formatter)
                 handler.setLevel(logging.DEBUG)
                 handler.addFilter(DebugOnlyFilter())
@@ -95,6 +148,16 @@ class WarningsChecker:
     def is_sub_checker(self):
         return self.name.endswith("_sub")
 
+    @property
+    def sub_logger_name(self):
+        """str: Name of the logger of the sub-checkers, if any"""
+        return f"{self.name}_sub"
+
+    @property
+    def sub_checker_name(self):
+        """str/None: Name of the sub-checker for the JSON Lines output, None if this is no sub-checker"""
+        return None
+
     @property
     def cq_findings(self):
         """List[dict]: list of code quality findings"""
@@ -157,6 +220,39 @@ class WarningsChecker:
         """
         return
 
+    def check_file(self, file):
+        """Function for counting the number of warnings in an open file
+
+        By default, the content of the file is read at once and passed to ``check``.
+
+        Args:
+            file (io.TextIOBase): The open file to parse
+        """
+        self.check(file.read())
+
+    def feed(self, chunk):
+        """Function for counting the number of warnings in a stream of text, one chunk at a time
+
+        By default, the chunks are collected and checked at once by ``flush``.
+
+        Args:
+            chunk (str): The next chunk of the content to parse
+        """
+        self._chunks.append(chunk)
+
+    def flush(self):
+        """Function for counting the number of warnings in the remainder of the streamed content"""
+        content = "".join(self._chunks)
+        self._chunks = []
+        if content:
+            self.check(content)
+
+    def end_of_input(self):
+        """Function for counting the warnings that are held back until all input has been checked
+
+        By default, nothing is held back.
+        """
+
     def add_patterns(self, regexes, pattern_container):
         """Adds regexes as patterns to the specified container
 
@@ -169,7 +265,55 @@ class WarningsChecker:
                 raise TypeError("Expected a list value for exclude key in configuration file; got {}"
                                 .format(regexes.__class__.__name__))
             for regex in regexes:
-                pattern_container.append(re.compile(regex))
+                pattern = re.compile(regex)
+                self.guard_pattern(pattern)
+                pattern_container.append(pattern)
+            self._exclusion_decision.cache_clear()
+
+    def add_field_exclusions(self, globs_per_field, root=None):
+        """Adds globs to exclude matches based on the value of a specific field
+
+        The globs of a path field are gitignore-style globs, the globs of any other field match its whole value.
+
+        Args:
+            globs_per_field (dict|None): Mapping of a field name to a list of globs
+            root (str|None): Directory that anchored globs of a path field are relative to; defaults to the working
+                directory at the time the globs are added
+        """
+        if globs_per_field:
+            if not isinstance(globs_per_field, dict):
+                raise TypeError("Expected a mapping of field names to lists of globs for exclude_fields key in "
+                                f"configuration file; got {globs_per_field.__class__.__name__}")
+            for field, globs in globs_per_field.items():
+                if not isinstance(globs, list):
+                    raise TypeError(f"Expected a list value for field {field!r} of exclude_fields key in "
+                                    f"configuration file; got {globs.__class__.__name__}")
+                if (index := self.field_exclusions.get(field.lower())) is None:
+                    if field.lower() in PATH_FIELDS:
+                        index = GlobIndex(root=os.path.abspath(root or os.curdir))
+                    else:
+                        index = GlobList()
+                    self.field_exclusions[field.lower()] = index
+                for glob in globs:
+                    index.add(glob)
+
+    def guard_pattern(self, pattern):
+        """Checks a user-supplied regex for catastrophic backtracking before it gets applied to any input
+
+        A warning is logged when the regex has a shape that is known to be prone to catastrophic backtracking. Such a
+        regex is probed with short adversarial strings, and the time it took is reported as well when a search
+        exceeded the time budget. The timing depends on the load of the machine, so the regex is not rejected.
+
+        Args:
+            pattern (re.Pattern): The compiled regex
+        """
+        if shape := find_backtracking_shape(pattern):
+            self.logger.warning(f"Regex {pattern.pattern!r} contains {shape}, which may cause catastrophic "
+                                "backtracking")
+            if probe_result := probe_backtracking(pattern):
+                length, elapsed = probe_result
+                self.logger.warning(f"Regex {pattern.pattern!r} took {elapsed:.2f}s to search a string of "
+                                    f"{length} characters")
 
     def return_count(self):
         """Getter function for the amount of warnings found
@@ -217,11 +361,37 @@ class WarningsChecker:
         self.logger.warning(string_to_print)
         return error_code
 
-    def parse_config(self, config):
+    def apply_limits(self, config):
+        """Replaces the limits by the ones of the given configuration, e.g. of a limit profile
+
+        Args:
+            config (dict): Configuration with a ``min`` and ``max``
+        """
         substitute_envvar(config, {"min", "max"})
+        self._minimum = 0
         self.maximum = int(config["max"])
         self.minimum = int(config["min"])
+
+    def save_limits(self):
+        """Returns the limits of this checker and its sub-checkers, e.g. before the ones of a limit profile are applied
+
+        Returns:
+            object: The limits to pass to ``restore_limits``
+        """
+        return self._minimum, self._maximum
+
+    def restore_limits(self, limits):
+        """Restores the limits that ``save_limits`` returned
+
+        Args:
+            limits (object): The limits that ``save_limits`` returned
+        """
+        self._minimum, self._maximum = limits
+
+    def parse_config(self, config):
+        self.apply_limits(config)
         self.add_patterns(config.get("exclude"), self.exclude_patterns)
+        self.add_field_exclusions(config.get("exclude_fields"), config.get("exclude_fields_root"))
         if "cq_default_path" in config:
             self.cq_default_path = config["cq_default_path"]
         if "cq_description_template" in config:
@@ -238,12 +408,111 @@ class WarningsChecker:
         Returns:
             bool: True for exclusion, False for inclusion
         """
-        matching_exclude_pattern = self._search_patterns(content, self.exclude_patterns)
-        if not self._search_patterns(content, self.include_patterns) and matching_exclude_pattern:
+        if not self.exclude_patterns:
+            return False
+        matching_exclude_pattern = self._exclusion_decision(content)
+        if matching_exclude_pattern:
             self.logger.info(f"Excluded {content!r} because of configured regex {matching_exclude_pattern!r}")
             return True
         return False
 
+    def _is_field_excluded(self, content, field_value):
+        """Checks if the specific text must be excluded based on the configured globs for the value of a field.
+
+        Inclusion based on the configured regexes has priority over exclusion.
+
+        Args:
+            content (str): The content to parse
+            field_value (Callable[[str], str|None]): Function that returns the value of a field by its name
+
+        Returns:
+            bool: True for exclusion, False for inclusion
+        """
+        for field, index in self.field_exclusions.items():
+            if (value := field_value(field)) and (glob := index.match(value)):
+                if self._search_patterns(content, self.include_patterns):
+                    return False
+                self.logger.info(f"Excluded {content!r} because of configured {field} glob {glob!r}")
+                return True
+        return False
+
+    def _find_exclusion(self, content):
+        """Scans the configured regexes for exclusion and inclusion; the result is memoized per content string
+
+        Args:
+            content (str): The content to parse
+
+        Returns:
+            str/None: The regex of the exclude pattern that applies, None if the content is not excluded
+        """
+        matching_exclude_pattern = self._search_patterns(content, self.exclude_patterns)
+        if matching_exclude_pattern and not self._search_patterns(content, self.include_patterns):
+            return matching_exclude_pattern
+        return None
+
+    def log_exclusion_cache_info(self):
+        """Logs the statistics of the cache of exclusion decisions in verbose mode, if it got any hits"""
+        info = self._exclusion_decision.cache_info()
+        if info.hits:
+            self.logger.info(f"exclusion cache: {info.hits} hits, {info.misses} misses, "
+                             f"{info.currsize}/{info.maxsize} entries")
+
+    def write_jsonl_record(self, description, **fields):
+        """Writes the JSON Lines record of a counted warning
+
+        Args:
+            description (str): Description of the warning
+            **fields: Optional ``path``, ``line``, ``severity`` and ``log_line`` of the warning
+        """
+        self.jsonl_writer.write(self.name.replace("_sub", ""), self.sub_checker_name, description, **fields)
+
+    def _log_line_counter(self, content):
+        """Returns a function that converts a position in the content to the number of the line in the log
+
+        The function counts the newlines since the previous position, so positions must be passed in increasing order.
+        Lines of previously streamed blocks are taken into account.
+
+        Args:
+            content (str): The content that is being checked
+
+        Returns:
+            Callable[[int], int]: Function that returns the line number of a position in the content
+        """
+        position = 0
+        line = self._log_line_offset + 1
+
+        def log_line(new_position):
+            nonlocal position, line
+            line += content.count("\n", position, new_position)
+            position = new_position
+            return line
+
+        return log_line
+
+    def close_logging(self):
+        """Removes the handlers of the loggers of this checker and its sub-checkers
+
+        A next checker with the same name, e.g. of another job of a manifest, adds handlers for its own output.
+        """
+        for logger_name in (self.name, self.sub_logger_name):
+            logger = logging.getLogger(logger_name)
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+                handler.close()
+
+    def log_console_summary(self):
+        """Logs how many verbose lines of this checker and its sub-checkers the console budget has held back
+
+        The budget is lifted, so that the lines that are logged after this one reach the console.
+        """
+        suppressed = 0
+        for logger_name in (self.name, self.sub_logger_name):
+            for handler in logging.getLogger(logger_name).handlers:
+                suppressed += sum(log_filter.release() for log_filter in handler.filters
+                                  if isinstance(log_filter, ConsoleBudgetFilter))
+        if suppressed:
+            self.logger.info(f"... and {suppressed:,} more")
+
     @staticmethod
     def _search_patterns(content, patterns):
         """Returns the regex of the first pattern that matches specified content, None if nothing matches"""
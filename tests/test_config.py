@@ -2,6 +2,7 @@ import logging
 import os
 from pathlib import Path
 from unittest import TestCase
+from unittest.mock import patch
 
 import pytest
 
@@ -107,6 +108,21 @@ class TestConfig(TestCase):
         warnings.check(deprecation_warning)
         self.assertEqual(warnings.return_count(), 1)
 
+    def test_configfile_parsing_exclude_cache(self):
+        warnings = WarningsPlugin()
+        warnings.config_parser((TEST_IN_DIR / "config_example_exclude.json"), True, None)
+        toctree_warning = "/home/bljah/test/index.rst:5: WARNING: toctree contains reference to nonexisting document "\
+                          "u'installation'"
+        warnings.check("\n".join([toctree_warning] * 3))
+        self.assertEqual(warnings.return_count(), 0)
+        excluded_toctree_warning = "Excluded {!r} because of configured regex {!r}".format(toctree_warning,
+                                                                                           "WARNING: toctree")
+        self.assertEqual(self.caplog.messages.count(excluded_toctree_warning), 3)
+        cache_info = warnings.get_checker("sphinx")._exclusion_decision.cache_info()
+        self.assertEqual((cache_info.hits, cache_info.misses), (2, 1))
+        warnings.log_exclusion_cache_info()
+        self.assertEqual(self.caplog.messages[-1], "exclusion cache: 2 hits, 1 misses, 1/4096 entries")
+
     def test_partial_sphinx_config_parsing(self):
         warnings = WarningsPlugin()
         tmpjson = {
@@ -594,3 +610,172 @@ class TestConfig(TestCase):
             warnings.config_parser(tmpjson, False, None)
         self.assertEqual(str(c_m.exception),
                          "Invalid argument: minimum limit must be lower than maximum limit (9); cannot set 10.")
+
+    def test_custom_checker(self):
+        warnings = WarningsPlugin(cq_enabled=True)
+        tmpjson = {
+            "sphinx": {
+                "enabled": True,
+                "min": 0,
+                "max": 0,
+            },
+            "custom": {
+                "lint": {
+                    "enabled": True,
+                    "pattern": r"(?m)^LINT (?P<file>[^:]+):(?P<lineno>\d+) \[(?P<level>\w+)\] (?P<message>.+)$",
+                    "fields": {
+                        "path": "file",
+                        "line": "lineno",
+                        "severity": "level",
+                        "description": "message",
+                    },
+                    "severity_map": {
+                        "W": "minor",
+                        "E": "blocker",
+                    },
+                    "exclude": ["generated"],
+                    "min": 1,
+                    "max": 2,
+                },
+                "disabled": {
+                    "enabled": False,
+                },
+            },
+        }
+        warnings.config_parser(tmpjson, True, None)
+        self.assertEqual(list(warnings.activated_checkers), ["sphinx", "lint"])
+        warnings.check("LINT src/main.c:12 [W] unused variable 'x'\n"
+                       "LINT src/generated.c:3 [E] implicit declaration\n"
+                       "index.rst:5: WARNING: toctree contains reference to nonexisting document\n"
+                       "LINT src/util.c:7 [E] implicit declaration\n")
+        self.assertEqual(warnings.return_count("lint"), 2)
+        self.assertEqual(warnings.return_count("sphinx"), 1)
+        self.assertEqual(warnings.return_check_limits("lint"), 0)
+        self.assertIn("Lint: Config parsing completed", self.caplog.messages)
+        self.assertEqual([(finding["severity"], finding["description"], finding["location"]["path"],
+                           finding["location"]["positions"]["begin"]["line"])
+                          for finding in warnings.get_checker("lint").cq_findings],
+                         [("minor", "unused variable 'x'", "src/main.c", 12),
+                          ("blocker", "implicit declaration", "src/util.c", 7)])
+
+    def test_custom_checker_invalid(self):
+        custom_config = {
+            "enabled": True,
+            "pattern": r"(?P<message>.+)",
+            "min": 0,
+            "max": 0,
+        }
+        with self.assertRaises(WarningsConfigError) as c_m:
+            WarningsPlugin().config_parser({"custom": {"sphinx": custom_config}}, False, None)
+        self.assertEqual(str(c_m.exception), "Custom checker name 'sphinx' is already in use by another checker")
+        with self.assertRaises(WarningsConfigError) as c_m:
+            WarningsPlugin().config_parser({"custom": {"lint": {**custom_config, "fields": {"path": "file"}}}},
+                                           False, None)
+        self.assertEqual(str(c_m.exception),
+                         "Custom checker 'lint' maps field 'path' to group 'file', which does not exist in its pattern")
+        with self.assertRaises(WarningsConfigError) as c_m:
+            WarningsPlugin().config_parser({"custom": {"lint": {**custom_config, "pattern": "(unbalanced"}}},
+                                           False, None)
+        self.assertTrue(str(c_m.exception).startswith("Invalid pattern for custom checker 'lint': "))
+        with self.assertRaises(WarningsConfigError) as c_m:
+            WarningsPlugin().config_parser({"custom": {"lint": {"enabled": True, "min": 0, "max": 0}}}, False, None)
+        self.assertEqual(str(c_m.exception), "Incomplete config. Missing: 'pattern'")
+
+    def test_exclude_backtracking_warning(self):
+        warnings = WarningsPlugin()
+        tmpjson = {
+            "sphinx": {
+                "enabled": True,
+                "min": 0,
+                "max": 0,
+                "exclude": [r"WARNING: (?:\w+:\s*)+toctree"],
+            }
+        }
+        warnings.config_parser(tmpjson, False, None)
+        self.assertIn("Regex 'WARNING: (?:\\\\w+:\\\\s*)+toctree' contains an unbounded quantifier on a group that "
+                      "contains an unbounded quantifier, which may cause catastrophic backtracking",
+                      self.caplog.messages)
+
+    def test_exclude_backtracking_slow(self):
+        warnings = WarningsPlugin()
+        tmpjson = {
+            "junit": {
+                "enabled": True,
+                "min": 0,
+                "max": 0,
+                "exclude": [r"(a+)+$"],
+            }
+        }
+        warnings.config_parser(tmpjson, False, None)
+        warning_messages = [record.message for record in self.caplog.records if record.levelname == "WARNING"]
+        self.assertEqual(2, len(warning_messages))
+        self.assertRegex(warning_messages[1], r"^Regex '\(a\+\)\+\$' took \d+\.\d\ds to search a string of \d+ "
+                                              r"characters$")
+
+    def test_exclude_backtracking_single_delay(self):
+        delays = iter([1.0])
+        with patch("mlx.warnings.regex_guard._time_search", lambda pattern, string: next(delays, 0.0)):
+            WarningsPlugin().config_parser({"junit": {"enabled": True, "min": 0, "max": 0, "exclude": [r"(a+)+$"]}},
+                                           False, None)
+        warning_messages = [record.message for record in self.caplog.records if record.levelname == "WARNING"]
+        self.assertEqual(1, len(warning_messages))
+        self.assertTrue(warning_messages[0].endswith("which may cause catastrophic backtracking"))
+
+    def test_exclude_backtracking_without_parser(self):
+        with patch("mlx.warnings.regex_guard.sre_parse", None):
+            WarningsPlugin().config_parser({"junit": {"enabled": True, "min": 0, "max": 0, "exclude": [r"(a+)+$"]}},
+                                           False, None)
+        self.assertEqual([], [record for record in self.caplog.records if record.levelname == "WARNING"])
+
+    def test_exclude_fields_root(self):
+        warnings = WarningsPlugin()
+        tmpjson = {
+            "sphinx": {
+                "enabled": True,
+                "min": 0,
+                "max": 0,
+                "exclude_fields_root": "/work",
+                "exclude_fields": {
+                    "path": ["/doc/"],
+                    "description": ["excluded*details"],
+                },
+            },
+        }
+        warnings.config_parser(tmpjson, False, None)
+        warnings.check("/work/doc/index.rst:5: WARNING: excluded by anchored directory\n"
+                       "/other/doc/index.rst:5: WARNING: not excluded outside of the root\n"
+                       "src/index.rst:5: WARNING: excluded by description, see docs/api for details\n")
+        self.assertEqual(warnings.return_count("sphinx"), 1)
+
+    def test_exclude_fields(self):
+        warnings = WarningsPlugin()
+        tmpjson = {
+            "sphinx": {
+                "enabled": True,
+                "min": 0,
+                "max": 0,
+                "exclude_fields": {
+                    "path": ["third_party/", "/doc/generated/**", "*_autogen.rst"],
+                },
+            },
+            "coverity": {
+                "enabled": True,
+                "exclude_fields": {
+                    "checker": ["*MISRA C-2012 Rule 8.*"],
+                },
+            },
+        }
+        warnings.config_parser(tmpjson, True, None)
+        warnings.check("lib/third_party/index.rst:5: WARNING: excluded by directory\n"
+                       "doc/generated/api/index.rst:5: WARNING: excluded by anchored directory\n"
+                       "src/generated/api/index.rst:5: WARNING: not excluded by anchored directory\n"
+                       "doc/api_autogen.rst:5: WARNING: excluded by file name\n"
+                       "third_party.rst:5: WARNING: not excluded by file name\n")
+        self.assertEqual(warnings.return_count("sphinx"), 2)
+        self.assertIn("Excluded 'lib/third_party/index.rst:5: WARNING: excluded by directory' because of configured "
+                      "path glob 'third_party/'", self.caplog.messages)
+        warnings.check("/src/somefile.c:82: CID 113396 (#1 of 1): Coding standard violation (MISRA C-2012 Rule 8.4): "
+                       "Unclassified, Unspecified, Undecided, owner is nobody, first detected on 2017-07-27.\n"
+                       "/src/somefile.c:82: CID 113397 (#1 of 1): Coding standard violation (MISRA C-2012 Rule 10.1): "
+                       "Unclassified, Unspecified, Undecided, owner is nobody, first detected on 2017-07-27.\n")
+        self.assertEqual(warnings.return_count("coverity"), 1)
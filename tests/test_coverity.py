@@ -6,7 +6,7 @@ from unittest.mock import patch
 
 import pytest
 
-from mlx.warnings import Finding, WarningsPlugin, warnings_wrapper
+from mlx.warnings import Finding, WarningsConfigError, WarningsPlugin, warnings_wrapper
 
 TEST_IN_DIR = Path(__file__).parent / "test_in"
 TEST_OUT_DIR = Path(__file__).parent / "test_out"
@@ -77,6 +77,113 @@ class TestCoverityWarnings(TestCase):
         self.assertEqual(self.warnings.return_count(), 1)
         self.assertEqual([f"{dut2}"], self.caplog.messages)
 
+    def test_truncated_defect(self):
+        dut = "/src/somefile.c:80: CID 113396 (#1 of 2): Coding standard violation (MISRA C-2012 Rule 10.1): "\
+              "Unclassified, Unspecified, Undecided, owner is nobody, first detected on 2017-07-27."
+        self.warnings.check(dut)
+        self.assertEqual(self.warnings.return_count(), 0)
+        self.warnings.end_of_input()
+        self.assertEqual(self.warnings.return_count(), 1)
+        self.assertEqual([dut], self.caplog.messages)
+
+    def test_defect_events_out_of_order(self):
+        dut1 = "/src/somefile.c:82: CID 113396 (#2 of 2): Coding standard violation (MISRA C-2012 Rule 10.1): "\
+               "Unclassified, Unspecified, Undecided, owner is nobody, first detected on 2017-07-27."
+        dut2 = "/src/somefile.c:80: CID 113396 (#1 of 2): Coding standard violation (MISRA C-2012 Rule 10.1): "\
+               "Unclassified, Unspecified, Undecided, owner is nobody, first detected on 2017-07-27."
+        self.warnings.check(f"{dut1}\n{dut2}")
+        self.assertEqual(self.warnings.return_count(), 1)
+
+    def test_defect_in_multiple_inputs(self):
+        dut = "/src/somefile.c:82: CID 113396 (#1 of 1): Coding standard violation (MISRA C-2012 Rule 10.1): "\
+              "Unclassified, Unspecified, Undecided, owner is nobody, first detected on 2017-07-27."
+        self.warnings.check(dut)
+        self.warnings.check(dut)
+        self.assertEqual(self.warnings.return_count(), 1)
+
+    @patch("pathlib.Path.cwd")
+    def test_code_quality_other_locations(self, path_cwd_mock):
+        path_cwd_mock.return_value = "/home/user/myproject"
+        dut1 = "src/main.c:12: CID 113396 (#1 of 3): Coding standard violation (MISRA C-2012 Rule 10.1): "\
+               "Unclassified, Unspecified, Undecided, owner is nobody, first detected on 2017-07-27."
+        dut2 = "/home/user/myproject/src/somefile.c:82: CID 113396 (#2 of 3): Coding standard violation (MISRA "\
+               "C-2012 Rule 10.1): Unclassified, Unspecified, Undecided, owner is nobody, first detected on 2017-07-27."
+        dut3 = "src/somefile.c:82: CID 113396 (#3 of 3): Coding standard violation (MISRA C-2012 Rule 10.1): "\
+               "Unclassified, Unspecified, Undecided, owner is nobody, first detected on 2017-07-27."
+        self.warnings.get_checker("coverity").cq_enabled = True
+        self.warnings.check("\n".join([dut1, dut2, dut3]))
+        self.assertEqual(self.warnings.return_count(), 1)
+        finding = self.warnings.get_checker("coverity").cq_findings[0]
+        self.assertEqual("src/somefile.c", finding["location"]["path"])
+        self.assertEqual([{"path": "src/main.c", "lines": {"begin": 12}}], finding["other_locations"])
+
+    @patch("pathlib.Path.cwd")
+    def test_code_quality_other_locations_out_of_order(self, path_cwd_mock):
+        path_cwd_mock.return_value = "/home/user/myproject"
+        dut1 = "src/main.c:12: CID 113396 (#1 of 3): Coding standard violation (MISRA C-2012 Rule 10.1): "\
+               "Unclassified, Unspecified, Undecided, owner is nobody, first detected on 2017-07-27."
+        dut2 = "src/other.c:7: CID 113396 (#2 of 3): Coding standard violation (MISRA C-2012 Rule 10.1): "\
+               "Unclassified, Unspecified, Undecided, owner is nobody, first detected on 2017-07-27."
+        dut3 = "src/somefile.c:82: CID 113396 (#3 of 3): Coding standard violation (MISRA C-2012 Rule 10.1): "\
+               "Unclassified, Unspecified, Undecided, owner is nobody, first detected on 2017-07-27."
+        self.warnings.get_checker("coverity").cq_enabled = True
+        self.warnings.check("\n".join([dut3, dut1]))
+        self.warnings.check("\n".join([dut2, dut3]))
+        self.assertEqual(self.warnings.return_count(), 1)
+        finding = self.warnings.get_checker("coverity").cq_findings[0]
+        self.assertEqual("src/somefile.c", finding["location"]["path"])
+        self.assertEqual([{"path": "src/main.c", "lines": {"begin": 12}},
+                          {"path": "src/other.c", "lines": {"begin": 7}}],
+                         finding["other_locations"])
+
+    def test_settings_passed_on_to_classifications(self):
+        checker = self.warnings.get_checker("coverity")
+        checker.parse_config({
+            "enabled": True,
+            "cq_default_path": "some/path",
+            "exclude": ["CID 113396"],
+            "unclassified": {"min": 0, "max": 0},
+        })
+        checker.cq_enabled = True
+        for sub_checker in checker.checkers.values():
+            self.assertTrue(sub_checker.cq_enabled)
+            self.assertEqual("some/path", sub_checker.cq_default_path)
+            self.assertEqual(checker.exclude_patterns, sub_checker.exclude_patterns)
+            self.assertIs(checker.cq_description_template, sub_checker.cq_description_template)
+
+    def test_exclude_per_classification(self):
+        checker = self.warnings.get_checker("coverity")
+        checker.parse_config({
+            "enabled": True,
+            "exclude": ["CID 113396"],
+            "unclassified": {"min": 0, "max": -1},
+            "intentional": {"min": 0, "max": -1, "exclude": ["INFINITE_LOOP"]},
+        })
+        with open("tests/test_in/coverity_full.txt") as infile:
+            self.warnings.check(infile.read())
+        self.warnings.return_count()
+        self.assertEqual(8, checker.checkers["unclassified"].count)
+        self.assertEqual(1, len(checker.checkers["unclassified"].exclude_patterns))
+        self.assertEqual(2, len(checker.checkers["intentional"].exclude_patterns))
+
+    def test_group_by_checker(self):
+        dut1 = "/src/somefile.c:80: CID 113396 (#1 of 1): Coding standard violation (MISRA C-2012 Rule 10.1): "\
+               "Unclassified, Unspecified, Undecided, owner is nobody, first detected on 2017-07-27."
+        dut2 = "/src/somefile.c:82: CID 113397 (#1 of 1): Out-of-bounds write (OVERRUN): "\
+               "Bug, Major, Fix Required, owner is nobody, first detected on 2017-07-27."
+        checker = self.warnings.get_checker("coverity")
+        checker.parse_config({
+            "enabled": True,
+            "group_by": {"field": "checker", "limits": {"Out-of-bounds write (OVERRUN)": {"max": 0}}},
+            "unclassified": {"min": 0, "max": -1},
+            "bug": {"min": 0, "max": -1},
+        })
+        self.warnings.check(f"{dut1}\n{dut2}")
+        self.assertEqual(self.warnings.return_count(), 2)
+        self.assertEqual(self.warnings.return_check_limits(), 1)
+        self.assertEqual(["checker 'Out-of-bounds write (OVERRUN)': number of warnings (1) is higher than the maximum "
+                          "limit (0).", "Returning error code 1."], self.caplog.messages[-2:])
+
     def test_code_quality_without_config(self):
         filename = "coverity_cq.json"
         out_file = str(TEST_OUT_DIR / filename)
@@ -116,3 +223,69 @@ class TestCoverityWarnings(TestCase):
         ])
         self.assertEqual(10, retval)  # 8 + 2 not within range 6 and 7
         self.assertTrue(filecmp.cmp(out_file, ref_file))
+
+
+class TestCoverityJson(TestCase):
+    @pytest.fixture(autouse=True)
+    def caplog(self, caplog):
+        self.caplog = caplog
+
+    def setUp(self):
+        Finding.fingerprints = {}
+        self.warnings = WarningsPlugin(cq_enabled=True)
+        self.warnings.activate_checker_name("coverity_json", True, None)
+        with open(TEST_IN_DIR / "coverity.json") as file:
+            self.content = file.read()
+
+    def test_json_in_chunks(self):
+        checker = self.warnings.get_checker("coverity_json")
+        for index in range(0, len(self.content), 64):
+            checker.feed(self.content[index:index + 64])
+        checker.flush()
+        self.assertEqual(self.warnings.return_count(), 5)
+        self.assertIn("some/path/main.c:12: CID 446410 (#2 of 2): MISRA C-2012 The Essential Type Model (MISRA C-2012 "
+                      "Rule 10.3): Unclassified, Unspecified, Undecided, owner is Unassigned", self.caplog.messages)
+        self.assertIn("some/path/boot.c:40: CID 2f1ea4c9d6f1e1b26e0d8c7f1c0b3a51 (#1 of 1): Logically dead code "
+                      "(DEADCODE): Unclassified", self.caplog.messages)
+        self.assertEqual(self.warnings.get_checker("coverity_json").checkers["bug"].count, 1)
+        self.assertEqual(self.warnings.get_checker("coverity_json").checkers["intentional"].count, 1)
+
+    def test_json_issues_key_of_root_object(self):
+        content = self.content.replace('"type": "Coverity issues",',
+                                       '"type": "Coverity \\"issues\\": [ {}",\n'
+                                       '  "desktopAnalysisSettings": {"issues": [{"mergeKey": "nested"}]},', 1)
+        checker = self.warnings.get_checker("coverity_json")
+        for char in content:
+            checker.feed(char)
+        checker.flush()
+        self.assertEqual(self.warnings.return_count(), 5)
+        self.assertNotIn("Incomplete Coverity JSON input", " ".join(self.caplog.messages))
+
+    def test_json_incomplete(self):
+        self.warnings.check(self.content[:self.content.index('"mergeKey": "mk264736"')])
+        self.assertEqual(self.warnings.return_count(), 2)
+        self.assertTrue(any(message.startswith("Incomplete Coverity JSON input: ")
+                            for message in self.caplog.messages))
+
+    @patch("pathlib.Path.cwd")
+    def test_json_code_quality(self, path_cwd_mock):
+        path_cwd_mock.return_value = "/home/user/myproject"
+        self.warnings.check(self.content)
+        self.assertEqual(self.warnings.return_count(), 5)
+        findings = self.warnings.get_checker("coverity_json").cq_findings
+        self.assertEqual(len(findings), 5)
+        finding = next(finding for finding in findings if "446410" in finding["description"])
+        self.assertEqual("Coverity: CID 446410: MISRA C-2012 The Essential Type Model (MISRA C-2012 Rule 10.3)",
+                         finding["description"])
+        self.assertEqual("some/path/main.c", finding["location"]["path"])
+        self.assertEqual([{"path": "some/path/boot.c", "lines": {"begin": 55}}], finding["other_locations"])
+
+    def test_json_cli(self):
+        retval = warnings_wrapper(["--coverity-json", str(TEST_IN_DIR / "coverity.json")])
+        self.assertEqual(5, retval)
+
+    def test_json_combined_with_other_checker(self):
+        with self.assertRaises(WarningsConfigError) as context:
+            warnings_wrapper(["--coverity-json", "--sphinx", str(TEST_IN_DIR / "coverity.json")])
+        self.assertEqual(str(context.exception),
+                         "Coverity JSON checker cannot be combined with other warnings checkers")
@@ -1,8 +1,9 @@
+import io
 from unittest import TestCase
 
 import pytest
 
-from mlx.warnings import WarningsPlugin
+from mlx.warnings import CustomRegexChecker, WarningsPlugin
 
 
 class TestDoxygenWarnings(TestCase):
@@ -78,3 +79,62 @@ class TestDoxygenWarnings(TestCase):
         with open(dut_file) as open_file:
             self.warnings.check(open_file.read())
         self.assertEqual(self.warnings.return_count(), 22)
+
+    def test_code_quality_field_groups(self):
+        checker = self.warnings.get_checker("doxygen")
+        checker.cq_enabled = True
+        dut = "testfile.c:6: warning: group test: ignoring title \"Some test functions\" that does not match "\
+              "old title \"Some freaky test functions\"\n"
+        dut += "<v7.1>:8: warning: failed to parse inline code"
+        self.warnings.check(dut)
+        self.assertEqual(self.warnings.return_count(), 2)
+        findings = checker.cq_findings
+        self.assertEqual([(finding["severity"], finding["location"]["path"],
+                           finding["location"]["positions"]["begin"]["line"]) for finding in findings],
+                         [("major", "testfile.c", 6), ("major", ".gitlab-ci.yml", 8)])
+        self.assertEqual(findings[1]["description"], "failed to parse inline code")
+
+    def test_min_severity(self):
+        self.warnings.get_checker("doxygen").set_min_severity("error")
+        dut = "testfile.c:6: warning: group test: ignoring title \"Some test functions\"\n"\
+              "testfile.c:8: error: unexpected end of file\n"\
+              "notice: Output directory does not exist\n"
+        self.warnings.check(dut)
+        self.assertEqual(self.warnings.return_count(), 1)
+        self.assertEqual(["testfile.c:8: error: unexpected end of file"], self.caplog.messages)
+
+    def test_doxygen_warnings_txt_streamed(self):
+        with open("tests/test_in/doxygen_warnings.txt") as open_file:
+            content = open_file.read()
+        self.warnings.check(content)
+        expected_messages = list(self.caplog.messages)
+        self.caplog.clear()
+        streamed = WarningsPlugin()
+        streamed.activate_checker_name("doxygen", True, None)
+        streamed.check_stream(io.StringIO(content), chunk_size=7)
+        self.assertEqual(streamed.return_count(), 22)
+        self.assertEqual(expected_messages, self.caplog.messages)
+
+    def test_streamed_lines_not_held_back(self):
+        checker = self.warnings.get_checker("doxygen")
+        checker.feed("testfile.c:6: warning: unexpected new line\nsome text that is no warning\n")
+        self.assertEqual(checker.return_count(), 1)
+        checker.flush()
+
+    def test_multiline_window(self):
+        checker = CustomRegexChecker("multiline", True, None)
+        checker.parse_config({
+            "pattern": r"(?m)^ERROR: (?P<description>.+(?:\n {2}.+)*)",
+            "continuation": "  ",
+            "max_multiline_lines": 3,
+            "min": 0,
+            "max": 0,
+        })
+        self.caplog.clear()
+        for chunk in ("ERROR: first\n  sec", "ond\n  third\nERROR: single\nERROR: long\n", "  1\n", "  2\n", "  3\n",
+                      "  4\n"):
+            checker.feed(chunk)
+        checker.flush()
+        self.assertEqual(checker.return_count(), 3)
+        self.assertEqual(["ERROR: first\n  second\n  third", "ERROR: single", "ERROR: long\n  1\n  2\n  3"],
+                         self.caplog.messages)
@@ -1,4 +1,6 @@
 import filecmp
+import io
+import json
 import logging
 import os
 from pathlib import Path
@@ -7,7 +9,8 @@ from unittest.mock import patch
 
 import pytest
 
-from mlx.warnings import Finding, WarningsConfigError, exceptions, warnings_wrapper
+from mlx.warnings import Finding, WarningsConfigError, WarningsPlugin, exceptions, warnings_wrapper
+from mlx.warnings.output_writer import close_output
 
 TEST_IN_DIR = Path(__file__).parent / "test_in"
 TEST_OUT_DIR = Path(__file__).parent / "test_out"
@@ -86,6 +89,98 @@ class TestIntegration(TestCase):
         retval = warnings_wrapper(["--junit", "tests/test_in/junit_single_fail.xml"])
         self.assertEqual(1, retval)
 
+    def test_stdin(self):
+        with open("tests/test_in/doxygen_warnings.txt") as open_file:
+            with patch("sys.stdin", io.StringIO(open_file.read())):
+                retval = warnings_wrapper(["--doxygen", "-"])
+        self.assertEqual(22, retval)
+
+    def test_output_jsonl(self):
+        out_file = TEST_OUT_DIR / "sphinx_double_warning.jsonl"
+        retval = warnings_wrapper(["--sphinx", "--output-jsonl", str(out_file),
+                                   "tests/test_in/sphinx_double_warning.txt"])
+        self.assertEqual(2, retval)
+        with open(out_file, encoding="utf-8") as open_file:
+            records = [json.loads(line) for line in open_file]
+        self.assertEqual([1, 2], [record["log_line"] for record in records])
+        self.assertEqual({
+            "checker": "sphinx",
+            "sub_checker": None,
+            "path": "/home/bljah/test/index.rst",
+            "line": 5,
+            "severity": "major",
+            "description": "toctree contains reference to nonexisting document u'installation'",
+            "source": "tests/test_in/sphinx_double_warning.txt",
+            "log_line": 1,
+        }, records[0])
+
+    def test_output_jsonl_coverity_stdin(self):
+        out_file = TEST_OUT_DIR / "coverity_full.jsonl"
+        with open("tests/test_in/coverity_full.txt") as open_file:
+            with patch("sys.stdin", io.StringIO(open_file.read())):
+                retval = warnings_wrapper(["--coverity", "--output-jsonl", str(out_file), "-"])
+        self.assertEqual(11, retval)
+        with open(out_file, encoding="utf-8") as open_file:
+            records = [json.loads(line) for line in open_file]
+        self.assertEqual(11, len(records))
+        self.assertEqual(("unclassified", "major", "CID 446411: Infinite loop (INFINITE_LOOP)", 21),
+                         (records[0]["sub_checker"], records[0]["severity"], records[0]["description"],
+                          records[0]["log_line"]))
+
+    def test_profiles(self):
+        retval = warnings_wrapper(["--config", str(TEST_IN_DIR / "config_example_profiles.yml"),
+                                   "tests/test_in/sphinx_double_warning.txt"])
+        self.assertEqual(0, retval)
+        self.assertEqual(["Sphinx: number of warnings (2) is between limits 0 and inf. Well done.",
+                          "Limits of profile 'strict':",
+                          "Sphinx: number of warnings (2) is higher than the maximum limit (0). Returning error code 2.",
+                          "Limits of profile 'gating':",
+                          "Sphinx: number of warnings (2) is between limits 0 and 5. Well done."],
+                         self.stderr_lines)
+
+    def test_profile_selected(self):
+        retval = warnings_wrapper(["--config", str(TEST_IN_DIR / "config_example_profiles.yml"), "--profile", "strict",
+                                   "tests/test_in/sphinx_double_warning.txt"])
+        self.assertEqual(2, retval)
+
+    def test_profile_unknown(self):
+        with self.assertRaises(WarningsConfigError) as c_m:
+            warnings_wrapper(["--config", str(TEST_IN_DIR / "config_example_profiles.yml"), "--profile", "lenient",
+                              "tests/test_in/sphinx_double_warning.txt"])
+        self.assertEqual(str(c_m.exception), "Unknown profile 'lenient'; expected one of ['strict', 'gating']")
+
+    def test_manifest(self):
+        retval = warnings_wrapper(["--manifest", str(TEST_IN_DIR / "manifest_example.yml")])
+        self.assertEqual(2, retval)
+        for name, status, count in (("strict", "2", 2), ("all", "0", 3)):
+            with open(TEST_OUT_DIR / f"manifest_{name}.status", encoding="utf-8") as open_file:
+                self.assertEqual(f"{status}\n", open_file.read())
+            with open(TEST_OUT_DIR / f"manifest_{name}.txt", encoding="utf-8") as open_file:
+                self.assertEqual(count, len(open_file.read().splitlines()))
+
+    def test_manifest_with_logfile(self):
+        with self.assertRaises(SystemExit) as ex:
+            warnings_wrapper(["--manifest", str(TEST_IN_DIR / "manifest_example.yml"),
+                              "tests/test_in/sphinx_double_warning.txt"])
+        self.assertEqual(2, ex.exception.code)
+
+    def test_manifest_with_run_options(self):
+        out_file = TEST_OUT_DIR / "manifest_run_options.txt"
+        out_file.write_text("kept\n")
+        with self.assertRaises(SystemExit) as ex:
+            warnings_wrapper(["--manifest", str(TEST_IN_DIR / "manifest_example.yml"), "-o", str(out_file),
+                              "--jobs", "2"])
+        self.assertEqual(2, ex.exception.code)
+        self.assertIn("Manifest cannot be provided with --output, --jobs; these are configured per job in the "
+                      "manifest", self.stderr_lines)
+        self.assertEqual("kept\n", out_file.read_text())
+
+    def test_manifest_job_error(self):
+        retval = warnings_wrapper(["--manifest", str(TEST_IN_DIR / "manifest_job_error.yml")])
+        self.assertEqual(1, retval)
+        self.assertEqual("1\n", (TEST_OUT_DIR / "manifest_missing_config.status").read_text())
+        self.assertEqual("0\n", (TEST_OUT_DIR / "manifest_after_error.status").read_text())
+
     def test_single_defect_coverity(self):
         retval = warnings_wrapper(["--coverity", "tests/test_in/coverity_single_defect.txt"])
         self.assertEqual(1, retval)
@@ -138,6 +233,38 @@ class TestIntegration(TestCase):
                           "Coverity: Returning error code 11."],
                          self.stderr_lines)
 
+    def test_coverity_console_lines(self):
+        ref_file = str(TEST_IN_DIR / "cov_out.txt")
+        out_file = str(TEST_OUT_DIR / "cov_out_console_lines.txt")
+        retval = warnings_wrapper([
+            "--verbose",
+            "--console-lines", "2",
+            "--coverity",
+            "--output", out_file,
+            str(TEST_IN_DIR / "coverity_full.txt"),
+        ])
+        self.assertEqual(11, retval)
+        self.assertEqual(["Coverity: unclassified   | some/path/boot.c:32:5: CID 446411 (#1 of 1): Infinite loop "
+                          "(INFINITE_LOOP): Unclassified, Unspecified, Undecided, owner is Unassigned, defect "
+                          "only exists locally.",
+                          "Coverity: unclassified   | some/path/boot.c:55:12: CID 446410 (#1 of 1): MISRA C-2012 "
+                          "The Essential Type Model (MISRA C-2012 Rule 10.3, Required): Unclassified, "
+                          "Unspecified, Undecided, owner is Unassigned, defect only exists locally.",
+                          "Coverity: ... and 9 more",
+                          "Coverity: unclassified   | number of warnings (8) is higher than the maximum limit (0).",
+                          "Coverity: pending        | number of warnings (0) is exactly as expected. Well done.",
+                          "Coverity: bug            | number of warnings (0) is exactly as expected. Well done.",
+                          "Coverity: intentional    | number of warnings (1) is higher than the maximum limit (0).",
+                          "Coverity: false positive | number of warnings (2) is higher than the maximum limit (0).",
+                          "Coverity: Returning error code 11."],
+                         self.stderr_lines)
+        self.assertTrue(filecmp.cmp(out_file, ref_file))
+
+    def test_negative_console_lines(self):
+        with self.assertRaises(SystemExit) as ex:
+            warnings_wrapper(["--console-lines", "-1", "--junit", "tests/test_in/junit_single_fail.xml"])
+        self.assertEqual(2, ex.exception.code)
+
     def test_coverity_output(self):
         ref_file = str(TEST_IN_DIR / "cov_out.txt")
         out_file = str(TEST_OUT_DIR / "cov_out.txt")
@@ -156,6 +283,25 @@ class TestIntegration(TestCase):
                          self.stderr_lines)
         self.assertTrue(filecmp.cmp(out_file, ref_file))
 
+    def test_output_shared_by_checkers(self):
+        out_file = TEST_OUT_DIR / "shared_out.txt"
+        if out_file.exists():
+            out_file.unlink()
+        warnings = WarningsPlugin()
+        warnings.activate_checker_name("sphinx", False, out_file)
+        warnings.activate_checker_name("doxygen", False, out_file)
+        expected = []
+        for index in range(3):
+            warnings.get_checker("sphinx").check(f"/doc/index.rst:{index}: WARNING: sphinx {index}\n")
+            warnings.get_checker("doxygen").check(f"/src/main.h:{index}: warning: doxygen {index}\n")
+            expected += [f"Sphinx: /doc/index.rst:{index}: WARNING: sphinx {index}",
+                         f"Doxygen: /src/main.h:{index}: warning: doxygen {index}"]
+        self.assertEqual(6, warnings.return_count())
+        self.assertEqual(expected, out_file.read_text().splitlines())
+        warnings.get_checker("sphinx").check("/doc/index.rst:9: WARNING: last\n")
+        close_output()
+        self.assertEqual(expected + ["Sphinx: /doc/index.rst:9: WARNING: last"], out_file.read_text().splitlines())
+
     def test_two_arguments(self):
         retval = warnings_wrapper(["--junit", "tests/test_in/junit_single_fail.xml",
                                    "tests/test_in/junit_double_fail.xml"])
@@ -202,6 +348,36 @@ class TestIntegration(TestCase):
         retval = warnings_wrapper(["--junit", "tests/test_in/junit*.xml"])
         self.assertEqual(self.junit_warning_cnt, retval)
 
+    def test_junit_jobs(self):
+        args = ["--verbose", "--junit", "tests/test_in/junit_double_fail.xml", "tests/test_in/junit_single_fail.xml",
+                "tests/test_in/junit_no_fail.xml"]
+        retval = warnings_wrapper(args)
+        serial_lines = self.stderr_lines
+        reset_logging()
+        retval_jobs = warnings_wrapper(["--jobs", "2", *args])
+        self.assertEqual(self.junit_warning_cnt, retval_jobs)
+        self.assertEqual(retval, retval_jobs)
+        self.assertEqual(serial_lines, self.stderr_lines)
+
+    def test_junit_jobs_malformed_file(self):
+        content = (TEST_IN_DIR / "junit_double_fail.xml").read_text()
+        truncated_file = TEST_OUT_DIR / "junit_double_fail_truncated.xml"
+        truncated_file.write_text(content[:content.index("<testcase", content.index("mysecondfai1ure"))])
+        args = ["--verbose", "--junit", str(truncated_file), "tests/test_in/junit_single_fail.xml"]
+        retval = warnings_wrapper(args)
+        serial_lines = self.stderr_lines
+        reset_logging()
+        retval_jobs = warnings_wrapper(["--jobs", "2", *args])
+        self.assertEqual(3, retval_jobs)
+        self.assertEqual(retval, retval_jobs)
+        self.assertEqual(serial_lines, self.stderr_lines)
+
+    def test_junit_jobs_invalid(self):
+        for jobs in ("0", "-2", "two"):
+            with self.assertRaises(SystemExit) as ex:
+                warnings_wrapper(["--jobs", jobs, "--junit", "tests/test_in/junit_single_fail.xml"])
+            self.assertEqual(2, ex.exception.code)
+
     def test_max(self):
         retval = warnings_wrapper(["--junit", "--maxwarnings", "2", "tests/test_in/junit*.xml"])
         self.assertEqual(self.junit_warning_cnt, retval)
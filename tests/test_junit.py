@@ -33,6 +33,65 @@ class TestJUnitFailures(TestCase):
                           "test_warn_plugin_no_double_fail.mysecondfai1ure"],
                          self.caplog.messages)
 
+    def test_check_file(self):
+        with open("tests/test_in/junit_double_fail.xml") as xmlfile:
+            self.warnings.get_checker("junit").check_file(xmlfile)
+        self.assertEqual(self.warnings.return_count(), 2)
+        self.assertEqual(["test_warn_plugin_double_fail.myfirstfai1ure",
+                          "test_warn_plugin_no_double_fail.mysecondfai1ure"],
+                         self.caplog.messages)
+
+    def test_testsuite_root_with_nested_suites(self):
+        self.warnings.check(
+            '<testsuite name="all">'
+            '<testsuite name="one"><testcase classname="one" name="a"><failure message="x"/></testcase></testsuite>'
+            '<testsuite name="two"><testcase classname="two" name="b"><error message="y"/></testcase>'
+            '<testcase classname="two" name="c"><skipped/></testcase></testsuite>'
+            '</testsuite>'
+        )
+        self.assertEqual(self.warnings.return_count(), 2)
+        self.assertEqual(["one.a", "two.b"], self.caplog.messages)
+
+    def test_text_content_is_skipped(self):
+        self.warnings.check(
+            '<testsuite name="all">'
+            '<testcase classname="one" name="a"><system-out><![CDATA[<testcase name="x"/>]]>'
+            f'{"output " * 10000}</system-out><failure message="x">traceback</failure>'
+            '<system-err>errors</system-err></testcase>'
+            '<testcase classname="one" name="b"><system-out>passed</system-out></testcase>'
+            '</testsuite>'
+        )
+        self.assertEqual(self.warnings.return_count(), 1)
+        self.assertEqual(["one.a"], self.caplog.messages)
+
+    def test_incremental(self):
+        checker = self.warnings.get_checker("junit")
+        checker.feed('<testsuites><testsuite name="one"><testcase classname="one" name="a"><failure mess')
+        self.assertEqual(checker.count, 0)
+        checker.feed('age="x"/></testcase><testcase classname="one" name="b"><error/></testcase><testc')
+        self.assertEqual(checker.count, 2)
+        self.assertEqual(["one.a", "one.b"], self.caplog.messages)
+        checker.flush()
+        self.assertEqual(self.warnings.return_count(), 2)
+        self.assertTrue(self.caplog.messages[-1].startswith("unclosed token: line 1"))
+
+    def test_incomplete_file(self):
+        with open("tests/test_in/junit_double_fail.xml") as xmlfile:
+            content = xmlfile.read()
+        self.warnings.check(content[:content.rindex("</testcase>") + len("</testcase>")])
+        self.assertEqual(self.warnings.return_count(), 2)
+        self.assertEqual(3, len(self.caplog.messages))
+
+    def test_incremental_nested_suites(self):
+        checker = self.warnings.get_checker("junit")
+        checker.feed('<testsuite name="all"><testsuite name="one">'
+                     '<testcase classname="one" name="a"><failure/></testcase></testsuite>')
+        self.assertEqual(checker.count, 0)
+        checker.feed('</testsuite>')
+        checker.flush()
+        self.assertEqual(self.warnings.return_count(), 1)
+        self.assertEqual(["one.a"], self.caplog.messages)
+
     def test_invalid_xml(self):
         self.warnings.check("this is not xml")
         self.assertEqual(self.warnings.return_count(), 0)
@@ -84,3 +84,38 @@ class TestLimits(TestCase):
             self.warnings.configure_maximum(9)
         self.assertEqual(str(c_m.exception),
                          "Invalid argument: maximum limit must be higher than minimum limit (10); cannot set 9.")
+
+    def test_profile_checks_all_checkers(self):
+        warnings = WarningsPlugin()
+        warnings.config_parser({
+            "sphinx": {"enabled": True, "min": 0, "max": 5},
+            "doxygen": {"enabled": True, "min": 0, "max": 5},
+            "profiles": {"strict": {"sphinx": {"min": 0, "max": 0}, "doxygen": {"min": 0, "max": 0}}},
+        }, False, None)
+        warnings.check("index.rst:5: WARNING: toctree contains reference to nonexisting document u'installation'\n"
+                       "testfile.c:6: warning: unexpected new line\n"
+                       "testfile.c:7: warning: unexpected new line\n")
+        warnings.return_count()
+        with self.assertLogs(level="WARNING") as logs:
+            self.assertEqual(warnings.return_profile_check_limits("strict"), 1)
+        self.assertEqual(["number of warnings (1) is higher than the maximum limit (0). Returning error code 1.",
+                          "number of warnings (2) is higher than the maximum limit (0). Returning error code 2."],
+                         [record.getMessage() for record in logs.records])
+        self.assertEqual(warnings.get_checker("doxygen").return_check_limits(), 0)
+        self.assertEqual(warnings.get_checker("doxygen").maximum, 5)
+        self.assertEqual(warnings.return_check_limits(), 0)
+
+    def test_profile_with_non_limit_keys(self):
+        warnings = WarningsPlugin()
+        checker_config = {"enabled": True, "exclude": ["ignored"], "cq_default_path": "Doxyfile"}
+        warnings.config_parser({
+            "coverity": {"enabled": True, "unclassified": {"min": 0, "max": 1}},
+            "polyspace": {"enabled": True, "run-time check": [{"color": "red", "min": 0, "max": 1}]},
+            "profiles": {"strict": {
+                "coverity": dict(checker_config, unclassified={"min": 0, "max": 0}),
+                "polyspace": dict(checker_config, **{"run-time check": [{"color": "red", "min": 0, "max": 0}]}),
+            }},
+        }, False, None)
+        self.assertEqual(warnings.return_profile_check_limits("strict"), 0)
+        self.assertEqual(warnings.get_checker("coverity").checkers["unclassified"].maximum, 1)
+        self.assertEqual(warnings.get_checker("polyspace").checkers[0].maximum, 1)
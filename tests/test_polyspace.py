@@ -42,6 +42,19 @@ class TestCodeProverWarnings(unittest.TestCase):
         )
         self.assertEqual(count, 19)
 
+    def test_exclude_fields(self):
+        self.warnings = WarningsPlugin()
+        self.warnings.config_parser({
+            "polyspace": {
+                "enabled": True,
+                "exclude_fields": {"File": ["dummy_file_name.*"]},
+                "run-time check": [{"color": "red", "min": 0, "max": 0}, {"color": "orange", "min": 0, "max": 0}],
+            }
+        }, False, None)
+        with open(TEST_IN_DIR / "polyspace.tsv", newline="") as file:
+            self.warnings.check_logfile(file)
+        self.assertEqual(self.warnings.return_count(), 0)
+
 
 class TestBugFinderWarnings(unittest.TestCase):
     @pytest.fixture(autouse=True)
@@ -2,7 +2,7 @@ import unittest
 
 import pytest
 
-from mlx.warnings import RobotSuiteChecker, WarningsConfigError, WarningsPlugin, warnings_wrapper
+from mlx.warnings import RobotOutputChecker, RobotSuiteChecker, WarningsConfigError, WarningsPlugin, warnings_wrapper
 
 
 class TestRobotWarnings(unittest.TestCase):
@@ -53,6 +53,23 @@ class TestRobotWarnings(unittest.TestCase):
         )
         self.assertEqual(retval, 2)
 
+    def test_overlapping_suite_names(self):
+        self.dut.checkers = [
+            RobotSuiteChecker("Suite Two", *self.dut.logging_args),
+            RobotSuiteChecker("Two", *self.dut.logging_args),
+            RobotSuiteChecker("Suite One", *self.dut.logging_args),
+        ]
+        with open("tests/test_in/robot_double_fail.xml") as xmlfile:
+            self.warnings.check(xmlfile.read())
+        self.assertEqual([checker.count for checker in self.dut.checkers], [1, 1, 1])
+        self.assertEqual(
+            [
+                "Suite One &amp; Suite Two.Suite Two.Another test",
+                "Suite One &amp; Suite Two.Suite Two.Another test",
+                "Suite One &amp; Suite Two.Suite One.First Test",
+            ],
+            self.caplog.messages)
+
     def test_invalid_xml(self):
         self.warnings.check("this is not xml")
         self.assertEqual(self.warnings.return_count(), 0)
@@ -118,6 +135,90 @@ class TestRobotWarnings(unittest.TestCase):
                 self.warnings.return_count()
         self.assertEqual(str(exc.exception), "1 test suites have been ignored due to incomplete configuration: ['Empty Flash Product Id']")
 
+    def test_ignored_testsuites_of_multiple_inputs(self):
+        self.dut.checkers = [
+            RobotSuiteChecker('Empty Flash Mlx Device Project Id', *self.dut.logging_args),
+        ]
+        for _ in range(2):
+            with open('tests/test_in/robot_version_5.xml') as xmlfile:
+                self.warnings.check(xmlfile.read())
+        self.assertEqual(self.dut.ignored_testsuites, ['Empty Flash Product Id'])
+        self.assertEqual(len(self.dut.checkers[0].ignored_testsuites), 1)
+
+    def test_incremental(self):
+        with open("tests/test_in/robot_double_fail.xml") as xmlfile:
+            content = xmlfile.read()
+        split = content.index("Another test")
+        self.dut.feed(content[:split])
+        self.assertEqual([checker.count for checker in self.dut.checkers], [1, 0])
+        self.dut.feed(content[split:])
+        self.dut.flush()
+        self.assertEqual(self.warnings.return_count(), 2)
+
+    def test_incremental_missing_suite(self):
+        for checker in self.dut.checkers:
+            checker.check_suite_name = True
+        with open("tests/test_in/robot_single_fail.xml") as xmlfile:
+            content = xmlfile.read()
+        self.dut.feed(content[:content.index("Suite Two.Suite Two")])
+        with self.assertRaises(SystemExit) as c_m:
+            self.dut.flush()
+        self.assertEqual(c_m.exception.code, -1)
+
+
+class TestRobotOutput(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def caplog(self, caplog):
+        self.caplog = caplog
+
+    def setUp(self):
+        self.warnings = WarningsPlugin()
+        self.dut = self.warnings.activate_checker(RobotOutputChecker, True, None)
+
+    def test_suite_paths(self):
+        self.dut.parse_config({
+            "suites": [
+                {"name": "Suite One", "min": 1, "max": 1},
+                {"name": "Suite One & Suite Two.Suite Two", "min": 0, "max": 0},
+                {"name": "", "min": 2, "max": 2},
+            ],
+        })
+        with open("tests/test_in/robot_output.xml") as xmlfile:
+            self.warnings.check_logfile(xmlfile)
+        self.assertEqual([checker.count for checker in self.dut.checkers], [1, 1, 2])
+        self.assertEqual(self.warnings.return_check_limits(), 1)
+        self.assertIn("Suite One & Suite Two.Suite One.First Test", self.caplog.messages)
+
+    def test_partial_suite_name(self):
+        self.dut.parse_config({"suites": [{"name": "Two", "min": 0, "max": 0}], "check_suite_names": True})
+        with open("tests/test_in/robot_output.xml") as xmlfile:
+            with self.assertRaises(SystemExit) as c_m:
+                self.warnings.check(xmlfile.read())
+        self.assertEqual(c_m.exception.code, -1)
+
+    def test_disallow_unconfigured(self):
+        self.dut.parse_config({"suites": [{"name": "Suite Two", "min": 1, "max": 1}], "allow_unconfigured": False})
+        with open("tests/test_in/robot_output.xml") as xmlfile:
+            self.warnings.check(xmlfile.read())
+        with self.assertRaises(WarningsConfigError) as exc:
+            self.warnings.return_count()
+        self.assertEqual(str(exc.exception),
+                         "1 test suites have been ignored due to incomplete configuration: ['Suite One']")
+
+    def test_incremental(self):
+        self.dut.parse_config({"suites": [{"name": "", "min": 0, "max": 0}]})
+        with open("tests/test_in/robot_output.xml") as xmlfile:
+            content = xmlfile.read()
+        self.dut.feed(content[:content.index('name="Another test"')])
+        self.assertEqual(self.dut.checkers[0].count, 1)
+        self.dut.flush()
+        self.assertEqual(self.warnings.return_count(), 1)
+        self.assertTrue(self.caplog.messages[-1].startswith("unclosed token: line"))
+
+    def test_cli(self):
+        retval = warnings_wrapper(["--robot-output", "--name", "Suite Two", "tests/test_in/robot_output.xml"])
+        self.assertEqual(retval, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,7 +2,7 @@ from unittest import TestCase
 
 import pytest
 
-from mlx.warnings import WarningsPlugin
+from mlx.warnings import Finding, WarningsConfigError, WarningsPlugin
 
 
 class TestSphinxWarnings(TestCase):
@@ -85,9 +85,113 @@ class TestSphinxWarnings(TestCase):
         self.assertEqual(self.warnings.return_count(), 1)
         self.assertEqual([f"{duterr1.strip()}"], self.caplog.messages)
 
+    def test_deprecation_warning_included_code_quality(self):
+        warnings = WarningsPlugin(cq_enabled=True)
+        warnings.activate_checker_name("sphinx", False, None)
+        warnings.get_checker("sphinx").include_sphinx_deprecation()
+        warnings.check("/usr/local/lib/python3.5/dist-packages/sphinx/application.py:402: RemovedInSphinx20Warning: "
+                       "app.info() is now deprecated. Use sphinx.util.logging instead.\n"
+                       "index.rst:5: WARNING: toctree contains reference to nonexisting document u'installation'\n")
+        self.assertEqual(warnings.return_count(), 2)
+        findings = warnings.get_checker("sphinx").cq_findings
+        self.assertEqual(1, len(findings))
+        self.assertEqual("toctree contains reference to nonexisting document u'installation'",
+                         findings[0]["description"])
+        self.assertEqual("index.rst", findings[0]["location"]["path"])
+
+    def test_match_cache_code_quality(self):
+        dut = "index.rst:5: WARNING: toctree contains reference to nonexisting document u'installation'\n"\
+              "ERROR: Unknown directive type \"foo\".\n"
+        findings = []
+        shared_cache = {}
+        for match_cache in (None, shared_cache, shared_cache):
+            Finding.fingerprints = {}
+            warnings = WarningsPlugin(cq_enabled=True)
+            warnings.activate_checker_name("sphinx", False, None)
+            warnings.get_checker("sphinx").match_cache = match_cache
+            warnings.check(dut)
+            self.assertEqual(warnings.return_count(), 2)
+            findings.append(warnings.get_checker("sphinx").cq_findings)
+        self.assertEqual(findings[0], findings[1])
+        self.assertEqual(findings[0], findings[2])
+
     def test_warning_no_docname(self):
         duterr1 = "WARNING: List item 'CL-UNDEFINED_CL_ITEM' in merge/pull request 138 is not defined as a "\
                   "checklist-item.\n"
         self.warnings.check(duterr1)
         self.assertEqual(self.warnings.return_count(), 1)
         self.assertEqual([f"{duterr1.strip()}"], self.caplog.messages)
+
+    def test_unique_warnings(self):
+        self.warnings.get_checker("sphinx").parse_config({"min": 0, "max": 0, "unique": True})
+        duterr1 = "/home/bljah/test/index.rst:5: WARNING: toctree contains reference to nonexisting document "\
+                  "u'installation'"
+        duterr2 = "/home/bljah/test/index.rst:5: WARNING: toctree contains reference to  nonexisting document "\
+                  "u'installation'"
+        duterr3 = "/home/bljah/test/index.rst:6: WARNING: toctree contains reference to nonexisting document "\
+                  "u'installation'"
+        self.warnings.check("\n".join([duterr1, duterr2, duterr1, duterr3]))
+        self.warnings.check(duterr3)
+        self.assertEqual(self.warnings.return_count(), 2)
+        self.assertEqual([duterr1, duterr3], self.caplog.messages)
+
+    def test_min_severity(self):
+        dut = "index.rst:1: DEBUG: some debug message\n"\
+              "index.rst:2: INFO: some info message\n"\
+              "index.rst:3: WARNING: toctree contains reference to nonexisting document u'installation'\n"\
+              "ERROR: Unknown directive type \"foo\".\n"
+        self.warnings.get_checker("sphinx").parse_config({"min": 0, "max": 0, "min_severity": "Warning"})
+        self.warnings.check(dut)
+        self.assertEqual(self.warnings.return_count(), 2)
+        self.assertEqual(["index.rst:3: WARNING: toctree contains reference to nonexisting document u'installation'",
+                          "ERROR: Unknown directive type \"foo\"."], self.caplog.messages)
+
+    def test_min_severity_deprecation_included(self):
+        self.warnings.get_checker("sphinx").set_min_severity("error")
+        self.warnings.get_checker("sphinx").include_sphinx_deprecation()
+        dut = "index.rst:2: INFO: some info message\n"\
+              "index.rst:3: WARNING: toctree contains reference to nonexisting document u'installation'\n"\
+              "application.py:402: RemovedInSphinx20Warning: app.info() is now deprecated.\n"
+        self.warnings.check(dut)
+        self.assertEqual(self.warnings.return_count(), 1)
+
+    def test_group_by_severity(self):
+        dut = "index.rst:1: ERROR: Unknown directive type \"foo\".\n"\
+              "index.rst:2: WARNING: toctree contains reference to nonexisting document u'installation'\n"\
+              "index.rst:3: WARNING: toctree contains reference to nonexisting document u'usage'\n"
+        checker = self.warnings.get_checker("sphinx")
+        checker.parse_config({"min": 0, "max": -1, "group_by": {"field": "severity", "limits": {
+            "ERROR": {"max": 0},
+            "WARNING": {"max": 2},
+            "CRITICAL": {"min": 1},
+        }}})
+        self.warnings.check(dut)
+        self.assertEqual(self.warnings.return_count(), 3)
+        self.assertEqual({"error": 1, "warning": 2}, checker.group_counts)
+        self.caplog.clear()
+        self.assertEqual(self.warnings.return_check_limits(), 2)
+        self.assertEqual(["severity 'ERROR': number of warnings (1) is higher than the maximum limit (0).",
+                          "severity 'CRITICAL': number of warnings (0) is lower than the minimum limit (1).",
+                          "Returning error code 2."], self.caplog.messages)
+
+    def test_group_by_severity_deprecation_included(self):
+        checker = self.warnings.get_checker("sphinx")
+        checker.parse_config({"min": 0, "max": -1, "group_by": {"field": "severity", "limits": {"ERROR": {"max": 0}}}})
+        checker.include_sphinx_deprecation()
+        self.warnings.check("index.rst:1: ERROR: Unknown directive type \"foo\".\n"
+                            "application.py:402: RemovedInSphinx20Warning: app.info() is now deprecated.\n")
+        self.assertEqual({"error": 1, "removedinsphinx20warning": 1}, checker.group_counts)
+        self.assertEqual(self.warnings.return_check_limits(), 1)
+
+    def test_group_by_invalid_field(self):
+        with self.assertRaises(WarningsConfigError) as c_m:
+            self.warnings.get_checker("sphinx").parse_config({"min": 0, "max": 0, "group_by": {"field": "checker"}})
+        self.assertEqual(str(c_m.exception), "Cannot group warnings of checker 'sphinx' by 'checker': the regex has no "
+                                             "named group for it")
+
+    def test_min_severity_invalid(self):
+        with self.assertRaises(WarningsConfigError) as c_m:
+            self.warnings.get_checker("sphinx").set_min_severity("fatal")
+        self.assertEqual(str(c_m.exception), "Invalid value 'fatal' for 'min_severity' of checker 'sphinx'; expected "
+                                             "one of ['debug', 'info', 'notice', 'warning', 'error', 'failed', "
+                                             "'severe', 'critical']")
@@ -148,3 +148,19 @@ class TestWarningsPlugin(TestCase):
         invalid_checker_name = "non-existent"
         warnings.activate_checker_name(invalid_checker_name, *self.logging_args)
         self.assertEqual([f"Checker {invalid_checker_name} does not exist"], self.caplog.messages)
+
+    def test_count_only(self):
+        with open("tests/test_in/mixed_warnings.txt") as open_file:
+            content = open_file.read()
+        names = ("sphinx", "doxygen", "xmlrunner")
+        warnings = WarningsPlugin()
+        for name in names:
+            self.assertTrue(warnings.activate_checker_name(name, *self.logging_args).is_count_only)
+        warnings.check(content)
+        counts = [warnings.return_count(name) for name in names]
+        warnings = WarningsPlugin()
+        for name in names:
+            self.assertFalse(warnings.activate_checker_name(name, True, None).is_count_only)
+        warnings.check(content)
+        self.assertEqual(counts, [warnings.return_count(name) for name in names])
+        self.assertEqual(counts, [2, 4, 1])